@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+import threading
+import pandas as pd
+
+CACHE_DIR = '.cache'
+CACHE_VERSION = 3
+
+_file_hashes = {}
+
+
+def file_hash(path):
+    """
+        SHA-256 of the content of the file at path.
+
+        Hashes are memoized per (path, mtime, size), so an unchanged file is only read once per process.
+    """
+    stat = os.stat(path)
+    fingerprint = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+    if fingerprint not in _file_hashes:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        _file_hashes[fingerprint] = digest.hexdigest()
+
+    return _file_hashes[fingerprint]
+
+
+def content_hash(content):
+    """
+        SHA-256 of content (bytes), for sources that are not files on disk, such as uploads.
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def cache_path(kind, *parts, suffix='.parquet'):
+    """
+        Path of the cache file of the given kind for the given key parts, ending with suffix.
+
+        The parts (file hashes, rename mappings, ...) are serialized together with CACHE_VERSION,
+        so changing any of them, or the cleaning code's version, selects a different file.
+    """
+    key = json.dumps([CACHE_VERSION, kind] + list(parts), sort_keys=True, default=str)
+    digest = hashlib.sha256(key.encode()).hexdigest()
+
+    return os.path.join(CACHE_DIR, kind, f'{digest}{suffix}')
+
+
+def source_cache_path(kind, source, *parts):
+    """
+        cache_path keyed by the content hash of the source file, or None if source is not a readable file path.
+    """
+    if not isinstance(source, (str, os.PathLike)) or not os.path.isfile(source):
+        return None
+
+    return cache_path(kind, file_hash(source), *parts)
+
+
+def read_frame(path):
+    """
+        Reads a cached DataFrame, returning None if there is no valid cache file at path.
+    """
+    if path is None or not os.path.exists(path):
+        return None
+
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        print(f"Ignoring unreadable cache file '{path}': {e}")
+        return None
+
+
+def write_frame(df, path):
+    """
+        Writes df to the cache file at path, returning whether it was written.
+
+        The file is written under a temporary name unique to the process and thread (each session runs in its own thread)
+        and moved into place, so concurrent sessions never write the same file or read a partial one.
+    """
+    if path is None:
+        return False
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+    try:
+        df.to_parquet(temp, index=False)
+        os.replace(temp, path)
+        return True
+    except Exception as e:
+        print(f"Could not cache DataFrame to '{path}': {e}")
+        if os.path.exists(temp):
+            os.remove(temp)
+        return False
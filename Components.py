@@ -1,8 +1,9 @@
 import streamlit as st
-import pandas as pd
-import tabula as tb
 import os
-import time
+import shutil
+import Cache
+import Extraction
+import Processors
 
 @st.experimental_fragment
 def file_uploader(text, filename, year_text):
@@ -30,24 +31,41 @@ def file_uploader(text, filename, year_text):
             file = st.file_uploader(f'{text}', type='pdf')
 
             if file:
-                Inputs = tb.read_pdf(file, pages='all', lattice=True)
+                content = file.getvalue()
+                staged = Cache.cache_path('Upload', Cache.content_hash(content), suffix='.xlsx')
 
-                full_table = pd.concat(Inputs, ignore_index=True)
+                if not os.path.exists(staged):
+                    progress = st.progress(0.0, text=f'Extracting {file.name}')
+
+                    def show_progress(page, count):
+                        if count:
+                            progress.progress(min(page / count, 1.0), text=f'Extracted page {page} of {count}')
+
+                    Extraction.ingest(content, staged, normalize=rename_first_four_columns, progress=show_progress, template='SeatMatrix')
+                    progress.empty()
                 
                 if not st.session_state.get('Inputs'):
                     st.session_state.Inputs = {}
 
-                st.session_state.Inputs[filename] = full_table
+                st.session_state.Inputs[filename] = staged
 
                 commit = st.button(f'Commit {file.name}')
 
                 if commit:
                     save_to_excel(st.session_state.Inputs[filename], filename)
-                    with st.spinner('Commiting and Refreshing'):
-                        time.sleep(3)
                     st.rerun()
 
+def rename_first_four_columns(df):
+    new_column_names = ['College Code', 'College Name', 'Branch Code', 'Branch Name']
+    current_columns = df.columns.tolist()
+    rename_mapping = {current_columns[i]: new_column_names[i] for i in range(min(len(current_columns), 4))}
+    df = df.rename(columns=rename_mapping)
+    return df
+
 def save_to_excel(df, filename):
+    """
+    Saves df, a DataFrame or the path of an Excel file already written by Extraction.ingest, as Inputs/filename.
+    """
     if not filename.endswith('.xlsx'):
         filename += '.xlsx'
 
@@ -58,12 +76,17 @@ def save_to_excel(df, filename):
     
     filepath = os.path.join(cwd, 'Inputs', filename)
     
-    df.to_excel(filepath, index=False)
+    if isinstance(df, str):
+        shutil.copyfile(df, filepath)
+    else:
+        df.to_excel(filepath, index=False)
+    Processors.clear_comparisons()
     st.success(f"Data saved as {filename}")
 
 def delete_file(filepath):
     try:
         os.remove(filepath)
+        Processors.clear_comparisons()
         print(f"File '{filepath}' deleted successfully.")
     except OSError as e:
         print(f"Error deleting the file '{filepath}': {e}")
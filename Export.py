@@ -0,0 +1,63 @@
+import tempfile
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import Workbook
+
+CHUNK_ROWS = 10000
+SPOOL_SIZE = 8 * 2**20
+
+FORMATS = {
+    'CSV' : ('csv', 'text/csv'),
+    'XLSX' : ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'Parquet' : ('parquet', 'application/vnd.apache.parquet')
+}
+
+
+def _chunks(df, chunk_rows):
+    for start in range(0, max(len(df), 1), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def _write_csv(df, f, chunk_rows):
+    for i, chunk in enumerate(_chunks(df, chunk_rows)):
+        f.write(chunk.to_csv(index=False, header=(i == 0)).encode())
+
+
+def _write_xlsx(df, f, chunk_rows):
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Sheet1')
+    sheet.append([str(column) for column in df.columns])
+
+    for chunk in _chunks(df, chunk_rows):
+        for row in chunk.astype(object).where(chunk.notna(), None).itertuples(index=False, name=None):
+            sheet.append(row)
+
+    workbook.save(f)
+
+
+def _write_parquet(df, f, chunk_rows):
+    df = df.rename(columns=str)
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+
+    with pq.ParquetWriter(f, schema) as writer:
+        for chunk in _chunks(df, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+_writers = {'CSV' : _write_csv, 'XLSX' : _write_xlsx, 'Parquet' : _write_parquet}
+
+
+def export(df, format, chunk_rows=CHUNK_ROWS):
+    """
+        Content of df exported in format (one of FORMATS), without its index.
+
+        The rows are written CHUNK_ROWS at a time into a temporary file that stays in memory up to SPOOL_SIZE
+        and spills to disk beyond it, so no full-size intermediate (such as the whole CSV as one string) is built.
+
+        Return:
+            bytes   =>   Content of the exported file.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE) as f:
+        _writers[format](df, f, chunk_rows)
+        f.seek(0)
+        return f.read()
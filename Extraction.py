@@ -0,0 +1,464 @@
+import io
+import json
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+import pyarrow.parquet as pq
+import tabula as tb
+from openpyxl import Workbook
+import Cache
+
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
+PAGES_PER_CHUNK = 8
+
+DEFAULT_OPTIONS = {'pages' : 'all', 'lattice' : True, 'pandas_options' : {'header' : None}}
+
+TEMPLATE_DIR = os.path.join(Cache.CACHE_DIR, 'Templates')
+
+
+def page_count(content):
+    """
+        Number of pages of a PDF, or None if it cannot be determined.
+
+        Uses pypdf when it is installed, and otherwise the largest /Count of the page tree, which is
+        the page count unless the page tree is hidden in a compressed object stream.
+    """
+    if pypdf is not None:
+        try:
+            return len(pypdf.PdfReader(io.BytesIO(content)).pages)
+        except Exception as e:
+            print(f'pypdf could not read the PDF ({e}), counting pages from the page tree...')
+
+    counts = [int(count) for count in re.findall(rb'/Type\s*/Pages\b[^>]*?/Count\s+(\d+)', content)]
+    counts += [int(count) for count in re.findall(rb'/Count\s+(\d+)[^>]*?/Type\s*/Pages\b', content)]
+
+    return max(counts) if len(counts) > 0 else None
+
+
+def _read_pages(path, pages, options):
+    return tb.read_pdf(path, pages=pages, **options)
+
+
+def _read_chunks(content, options):
+    """
+        Yields (last page, page count, tables) for every range of PAGES_PER_CHUNK pages of a PDF, in page order.
+
+        Ranges are extracted by parallel worker processes, spawned rather than forked from the multithreaded Streamlit
+        server, with one tabula call (and so one JVM) per range. At most one extracted range per worker waits to be
+        consumed, so only a few ranges are held in memory at a time.
+        A PDF that fits in one range, or whose page count is unknown, is extracted in one call, and ranges are
+        extracted serially with a single CPU or when the pool cannot be used.
+    """
+    count = page_count(content) if options.get('pages') == 'all' else None
+
+    if count == None or count <= PAGES_PER_CHUNK:
+        yield count, count, tb.read_pdf(io.BytesIO(content), **options)
+        return
+
+    options = {option : value for option, value in options.items() if option != 'pages'}
+    chunks = [list(range(start, min(start + PAGES_PER_CHUNK, count + 1))) for start in range(1, count + 1, PAGES_PER_CHUNK)]
+    workers = min(os.cpu_count() or 1, len(chunks))
+
+    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+        f.write(content)
+
+    done = 0
+    try:
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+                    pending = deque()
+                    try:
+                        for chunk in chunks:
+                            pending.append(pool.submit(_read_pages, f.name, chunk, options))
+
+                            if len(pending) > workers:
+                                tables = pending.popleft().result()
+                                yield chunks[done][-1], count, tables
+                                done += 1
+
+                        while len(pending) > 0:
+                            tables = pending.popleft().result()
+                            yield chunks[done][-1], count, tables
+                            done += 1
+                    except GeneratorExit:
+                        # Closed early by the consumer: drop the ranges not started yet instead of extracting them.
+                        for future in pending:
+                            future.cancel()
+                        raise
+            except Exception as e:
+                print(f'Could not extract pages in parallel ({e}), extracting serially...')
+
+        for chunk in chunks[done:]:
+            yield chunk[-1], count, _read_pages(f.name, chunk, options)
+    finally:
+        os.remove(f.name)
+
+
+def _template_path(kind):
+    return os.path.join(TEMPLATE_DIR, f'{kind}.json')
+
+
+def load_template(kind):
+    """
+        The saved layout template of a document type, or None if there is none.
+    """
+    path = _template_path(kind)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable template '{path}': {e}")
+        return None
+
+
+def delete_template(kind):
+    path = _template_path(kind)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def detect_template(content, kind):
+    """
+        Detects the layout of a document type from the ruling lines of the first pages of a PDF, and saves it as the template of kind.
+
+        The tables of the first two pages are read once in lattice mode as tabula JSON, which gives the position of every cell.
+        The template holds the area covering the table on both pages (the first page usually starts lower, below a title),
+        the left edges of the columns after the first one, and the header of the table.
+
+        Return:
+            dict   =>   The template ('area', 'columns' and 'header'), or None if no table with a header and consistent columns was found.
+    """
+    count = page_count(content)
+    pages = [1, 2] if count == None or count > 1 else [1]
+
+    try:
+        tables = tb.read_pdf(io.BytesIO(content), pages=pages, lattice=True, output_format='json')
+    except Exception as e:
+        print(f'Could not detect the layout of {kind} ({e})...')
+        return None
+
+    largest = {}
+    for table in tables:
+        if len(table.get('data', [])) > 0:
+            page = table.get('page_number')
+            if page not in largest or len(table['data']) > len(largest[page]['data']):
+                largest[page] = table
+
+    if len(largest) == 0:
+        return None
+
+    first = largest[min(largest)]
+    widest = max(first['data'], key=len)
+    header = [cell['text'] for cell in first['data'][0]]
+
+    if len(header) != len(widest) or len(header) < 2:
+        print(f'Could not detect the columns of {kind}, the header spans columns...')
+        return None
+
+    template = {
+        'area' : [min(table['top'] for table in largest.values()),
+                  min(table['left'] for table in largest.values()),
+                  max(table['bottom'] for table in largest.values()),
+                  max(table['right'] for table in largest.values())],
+        'columns' : [cell['left'] for cell in widest[1:]],
+        'header' : header
+    }
+
+    os.makedirs(TEMPLATE_DIR, exist_ok=True)
+    with open(_template_path(kind), 'w') as f:
+        json.dump(template, f)
+
+    return template
+
+
+def _template_options(template):
+    return {'lattice' : False, 'stream' : True, 'guess' : False, 'area' : template['area'], 'columns' : template['columns']}
+
+
+def _header_lines(header):
+    return [set() if pd.isna(value) else set(str(value).split('\r')) for value in header]
+
+
+def _is_header_line(row, lines):
+    return all(pd.isna(value) or str(value) in lines[i] for i, value in enumerate(row[:len(lines)]))
+
+
+def _header_start(table, lines):
+    """
+        Position of the first (non-empty) line of the header in a page table read in stream mode, or None if the page has no header.
+
+        The area of a template covers the tables of the first two pages, so on the first page, where the table starts lower,
+        it also takes in the lines of the title above the header.
+    """
+    for position, row in enumerate(table.itertuples(index=False, name=None)):
+        if not all(pd.isna(value) for value in row) and _is_header_line(row, lines):
+            return position
+    return None
+
+
+def _matches_template(table, layout):
+    """
+        Whether the first page table of a PDF read with a template has the template's columns and, below any title, its header.
+
+        Stream mode splits the header into lines; joined back per column, they must give the header recorded in the
+        template. A document whose columns moved gives a different header (or none), even though it still yields rows.
+    """
+    header = layout['header']
+    if len(table.columns) != len(header) or len(layout['columns']) != len(header) - 1:
+        return False
+
+    lines = _header_lines(header)
+    start = _header_start(table, lines)
+    if start is None:
+        return False
+
+    top = []
+    for row in table.iloc[start:].itertuples(index=False, name=None):
+        if not _is_header_line(row, lines):
+            break
+        top.append(row)
+
+    found = ['\r'.join(str(row[i]) for row in top if not pd.isna(row[i])) for i in range(len(header))]
+    return len(top) > 0 and found == ['' if pd.isna(value) else str(value) for value in header]
+
+
+def _unwrap_rows(table, header):
+    """
+        A page table read in stream mode, with the lines of wrapped cells joined into one row and the lines of the header
+        (and of any title above it) dropped.
+
+        Stream mode reads every line of text as a row, so a cell wrapped over several lines gives rows with an empty first
+        column. Their text is joined to the row above with '\r', as lattice mode joins the lines of a cell.
+    """
+    if len(table) == 0:
+        return table
+
+    lines = _header_lines(header)
+
+    start = _header_start(table, lines)
+    if start is not None:
+        table = table.iloc[start:]
+
+    table = table[~table.apply(_is_header_line, axis=1, args=(lines,))]
+
+    def _join(column):
+        values = column.dropna()
+        if len(values) == 0:
+            return None
+        return values.iloc[0] if len(values) == 1 else '\r'.join(str(value) for value in values)
+
+    starts = table.iloc[:, 0].notna().cumsum().to_numpy()
+    return table.groupby(starts, sort=False).agg(_join).reset_index(drop=True)
+
+
+def _column_names(header):
+    """
+        Column names from a header row, named and de-duplicated the way pandas names a header it reads.
+    """
+    names = []
+    seen = {}
+
+    for i, value in enumerate(header):
+        name = f'Unnamed: {i}' if pd.isna(value) else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        names.append(name)
+
+    return names
+
+
+def _repair_header(table, header):
+    """
+        A page table read without a header, given the columns named by header and without the rows repeating it.
+
+        Only the first page of a document has a header row, while some later pages repeat it, so tabula reads every
+        page with its first row as data. Surplus empty columns are dropped, and columns are then matched by position.
+    """
+    if len(table.columns) != len(header):
+        table = table.dropna(axis=1, how='all')
+
+    if len(table.columns) != len(header):
+        print(f'Page table has {len(table.columns)} columns instead of {len(header)}, matching them by position...')
+        table = table.set_axis(range(len(table.columns)), axis=1).reindex(columns=range(len(header)))
+
+    table = table.set_axis(_column_names(header), axis=1)
+    table = table[~table.astype(str).eq([str(value) for value in header]).all(axis=1)].reset_index(drop=True)
+
+    for column in table.columns:
+        if table[column].dtype == object:
+            try:
+                table[column] = pd.to_numeric(table[column])
+            except (ValueError, TypeError):
+                pass
+
+        if pd.api.types.is_float_dtype(table[column]) and table[column].notna().all() and (table[column] % 1 == 0).all():
+            table[column] = table[column].astype('int64')
+
+    return table
+
+
+def _cached_parts(key):
+    """
+        Paths of the Parquet files of the ranges of a cached extraction, or None if it is not cached or not readable.
+    """
+    if not os.path.isdir(key):
+        return None
+
+    parts = [os.path.join(key, part) for part in sorted(os.listdir(key))]
+
+    try:
+        for part in parts:
+            pq.read_metadata(part)
+    except Exception as e:
+        print(f"Ignoring unreadable cached extraction '{key}': {e}")
+        shutil.rmtree(key, ignore_errors=True)
+        return None
+
+    return parts
+
+
+def iter_tables(content, template=None, **options):
+    """
+        Yields (last page, page count, table) for every range of pages of a PDF, in page order, with repaired headers.
+
+        The ranges are cached by the SHA-256 of the PDF content and the tabula options, as one Parquet file per range
+        under Cache.CACHE_DIR, so a known PDF is replayed from the cache without reaching tabula. The ranges of a cached
+        PDF are reported by their position among the ranges. The page count is None when it cannot be determined.
+
+        With a template (a document type such as 'SeatMatrix'), the table area and columns are detected once (see detect_template)
+        and every page is extracted in stream mode with that fixed area and those columns, instead of detecting the ruling lines of
+        every page. If the first page does not start with the template's header in the template's columns (the layout changed), the
+        template is detected again from this PDF, and the PDF is extracted with lattice detection. If the template finds no rows,
+        it is discarded and the PDF is extracted with lattice detection.
+
+        Parameters:
+            (i) content : bytes        =>   Content of the PDF file.
+            (ii) template : str        =>   Document type whose layout template is used (and detected if not saved yet).
+            (iii) options              =>   Options passed to tabula.read_pdf, on top of DEFAULT_OPTIONS.
+    """
+    layout = None
+    if template != None:
+        layout = load_template(template) or detect_template(content, template)
+
+    if layout != None:
+        options, given = {**DEFAULT_OPTIONS, **_template_options(layout), **options}, options
+    else:
+        options = {**DEFAULT_OPTIONS, **options}
+
+    key = Cache.cache_path('PDF', Cache.content_hash(content), options)
+
+    parts = _cached_parts(key)
+    if parts != None:
+        for i, part in enumerate(parts):
+            yield i + 1, len(parts), Cache.read_frame(part)
+        return
+
+    temp = f'{key}.{os.getpid()}.{threading.get_ident()}.tmp'
+    os.makedirs(temp, exist_ok=True)
+    cached = True
+    header = layout['header'] if layout != None else None
+
+    try:
+        chunks = _read_chunks(content, options)
+        for part, (page, count, tables) in enumerate(chunks):
+            if layout != None and part == 0 and (len(tables) == 0 or not _matches_template(tables[0], layout)):
+                print(f"Template '{template}' does not match the layout of this PDF, detecting it again...")
+                chunks.close()
+                delete_template(template)
+                detect_template(content, template)
+                yield from iter_tables(content, **given)
+                return
+
+            frames = []
+            for table in tables:
+                if layout != None:
+                    table = _unwrap_rows(table, header)
+                if header is None and len(table) > 0:
+                    header = table.iloc[0].tolist()
+                if header is not None:
+                    frames.append(_repair_header(table, header))
+
+            table = pd.concat(frames, ignore_index=True) if len(frames) > 0 else pd.DataFrame()
+
+            if layout != None and part == 0 and len(table) == 0:
+                print(f"Template '{template}' found no rows, extracting with lattice detection...")
+                chunks.close()
+                delete_template(template)
+                yield from iter_tables(content, **given)
+                return
+
+            cached = cached and Cache.write_frame(table, os.path.join(temp, f'{part:05d}.parquet'))
+            yield page, count, table
+
+        if cached and not os.path.exists(key):
+            os.replace(temp, key)
+    finally:
+        shutil.rmtree(temp, ignore_errors=True)
+
+
+def ingest(content, path, normalize=None, progress=None, template=None, **options):
+    """
+        Streams the tables of a PDF into the Excel file at path, so only a few pages are held in memory at a time.
+
+        Rows are appended to a write-only workbook as the pages are extracted (see iter_tables), and the
+        file is moved into place only once it is complete.
+
+        Parameters:
+            (i) content : bytes           =>   Content of the PDF file.
+            (ii) path : str               =>   Excel file to be written.
+            (iii) normalize : function    =>   Applied to every table before it is written (e.g. renaming its columns).
+            (iv) progress : function      =>   Called with (last page, page count) after every range of pages is written.
+            (v) template : str            =>   Document type whose layout template is used (see iter_tables).
+            (vi) options                  =>   Options passed to tabula.read_pdf, on top of DEFAULT_OPTIONS.
+
+        Return:
+            int   =>   Number of rows written.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Sheet1')
+    columns = None
+    rows = 0
+
+    for page, count, table in iter_tables(content, template=template, **options):
+        if normalize != None:
+            table = normalize(table)
+
+        if columns is None and len(table.columns) > 0:
+            columns = list(table.columns)
+            sheet.append(columns)
+
+        for row in table.astype(object).where(table.notna(), None).itertuples(index=False, name=None):
+            sheet.append(row)
+        rows += len(table)
+
+        if progress != None:
+            progress(page, count)
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+    try:
+        workbook.save(temp)
+        os.replace(temp, path)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+    return rows
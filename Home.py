@@ -1,7 +1,7 @@
 import streamlit as st 
 import pandas as pd
 import os
-from Components import file_uploader
+from Components import file_uploader, rename_first_four_columns
 from background import BackgroundCSSGenerator
 
 # Set up Streamlit page configuration
@@ -49,13 +49,6 @@ else:
     with col2:
         file_uploader('Upload SeatMatrix **{}** th Year', 'b', 'N')
 
-    def rename_first_four_columns(df):
-        new_column_names = ['College Code', 'College Name', 'Branch Code', 'Branch Name']
-        current_columns = df.columns.tolist()
-        rename_mapping = {current_columns[i]: new_column_names[i] for i in range(min(len(current_columns), 4))}
-        df = df.rename(columns=rename_mapping)
-        return df
-
     def execute_script():
         df1 = pd.read_excel(r"Inputs/a.xlsx")
         df2 = pd.read_excel(r"Inputs/b.xlsx")
@@ -0,0 +1,185 @@
+import contextvars
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+import pandas as pd
+import streamlit as st
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+LOG_PATH = os.path.join('Logs', 'runs.jsonl')
+
+# Each Streamlit session runs its script on its own thread, and every thread starts with a fresh context,
+# so concurrent sessions never record stages into each other's Run.
+_active = contextvars.ContextVar('active_run', default=None)
+
+
+def peak_rss():
+    """
+        High-water mark of the resident memory of this process in bytes, or None where it is not available.
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class Run:
+    """
+        Records the elapsed time and memory use of every stage of one Process() or runForms() call.
+
+        Stages may be nested (e.g. each Excel write inside a pipeline). Every stage records 'rss_growth', how much
+        it raised the resident high-water mark of the process (0 when an earlier stage already went higher).
+        With trace_memory, allocations are also traced with tracemalloc, and 'peak' holds the peak of the Python
+        and NumPy allocations made within the stage, at the cost of running several times slower. When the run
+        ends, its stages are appended as one JSON line to LOG_PATH.
+
+
+        Available methods:
+
+          (i) __init__(name : str, status=None, trace_memory=False : bool) -> Reference of Run object
+
+          (ii) stage(label : str) -> context manager (Times the enclosed block as one stage)
+
+          (iii) record(label : str, seconds : float, peak=None : int) -> None (Adds a stage measured elsewhere, e.g. in a worker process)
+
+          (iv) frame() -> pd.DataFrame (One row per stage with its duration and memory use)
+
+          (v) show() -> None (Shows the stage timings in the sidebar)
+
+        Properties:
+          name : str
+          status : st.status container updated as top-level stages start and finish, or None
+          stages : List
+    """
+
+    def __init__(self, name, status=None, trace_memory=False):
+        self.name = name
+        self.status = status
+        self.stages = []
+        self.seconds = None
+        self.trace_memory = trace_memory
+        self._stack = []
+        self._token = None
+        self._traced = False
+
+    def __enter__(self):
+        self._started = datetime.now()
+        self._traced = self.trace_memory and not tracemalloc.is_tracing()
+        if self._traced:
+            tracemalloc.start()
+
+        self._token = _active.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self._start
+        if self._traced:
+            tracemalloc.stop()
+
+        _active.reset(self._token)
+        self.write_log()
+        return False
+
+    @contextmanager
+    def stage(self, label):
+        if self.status is not None and len(self._stack) == 0:
+            self.status.update(label=f'{label}...', state='running')
+
+        traced = self.trace_memory and tracemalloc.is_tracing()
+        if traced:
+            if len(self._stack) > 0:
+                self._stack[-1]['peak'] = max(self._stack[-1]['peak'] or 0, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        entry = {'stage' : label, 'depth' : len(self._stack), 'seconds' : None, 'peak' : None, 'rss_growth' : None}
+        self.stages.append(entry)
+        self._stack.append(entry)
+
+        rss = peak_rss()
+        start = time.perf_counter()
+        try:
+            yield entry
+        except Exception:
+            if self.status is not None:
+                self.status.update(label=f'{label} Failed', state='error')
+            raise
+        finally:
+            entry['seconds'] = time.perf_counter() - start
+            self._stack.pop()
+
+            if traced:
+                entry['peak'] = max(entry['peak'] or 0, tracemalloc.get_traced_memory()[1])
+                if len(self._stack) > 0:
+                    self._stack[-1]['peak'] = max(self._stack[-1]['peak'] or 0, entry['peak'])
+
+            if rss is not None:
+                entry['rss_growth'] = peak_rss() - rss
+
+        if self.status is not None and len(self._stack) == 0:
+            self.status.write(f"{label} : {entry['seconds']:.2f} s")
+
+    def record(self, label, seconds, peak=None):
+        self.stages.append({'stage' : label, 'depth' : len(self._stack), 'seconds' : seconds, 'peak' : peak, 'rss_growth' : None})
+
+    def frame(self):
+        mib = lambda value : None if value is None else value / 2**20
+
+        val = pd.DataFrame({
+            'Stage' : ['  ' * stage['depth'] + stage['stage'] for stage in self.stages],
+            'Seconds' : [stage['seconds'] for stage in self.stages],
+            'RSS Growth MiB' : [mib(stage['rss_growth']) for stage in self.stages]
+        })
+
+        if any(stage['peak'] is not None for stage in self.stages):
+            val['Traced Peak MiB'] = [mib(stage['peak']) for stage in self.stages]
+
+        return val
+
+    def show(self):
+        st.sidebar.subheader(f'{self.name} Stage Timings')
+        st.sidebar.dataframe(self.frame(), hide_index=True)
+
+    def write_log(self, path=LOG_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        entry = {
+            'run' : self.name,
+            'started' : self._started.isoformat(timespec='seconds'),
+            'seconds' : self.seconds,
+            'stages' : self.stages
+        }
+
+        try:
+            with open(path, 'a') as f:
+                f.write(json.dumps(entry) + '\n')
+        except OSError as e:
+            print(f"Could not append run log to '{path}': {e}")
+
+
+def stage(label):
+    """
+        Times the enclosed block as a stage of the active Run, or does nothing when no Run is active.
+    """
+    run = _active.get()
+    if run is None:
+        return nullcontext()
+    return run.stage(label)
+
+
+def record(label, seconds, peak=None):
+    """
+        Adds a stage measured elsewhere to the active Run, if any.
+    """
+    run = _active.get()
+    if run is not None:
+        run.record(label, seconds, peak)
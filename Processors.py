@@ -1,9 +1,461 @@
 from pickle import FALSE
 import pandas as pd
-import math
 import os
+import time
+import multiprocessing
+import threading
 import numpy as np
 import streamlit as st
+import Cache
+import Instrumentation
+from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+INDEX_KEYS = ['College Code', 'Branch Code', 'Allotted Community']
+
+ROUND_DTYPES = {
+  'Rank' : object,
+  'Cutoff Mark' : 'float32',
+  'College Code' : 'Int32',
+  'Branch Code' : 'category',
+  'Allotted Community' : 'category'
+}
+
+CATEGORY_COLUMNS = ['College Name', 'Branch Code', 'Branch Name', 'Allotted Community']
+COMMUNITY_COLUMNS = ['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']
+
+RANK_TIE_SLOTS = 1000
+UNRANKED_KEY = np.iinfo(np.int64).max
+
+SEARCH_NGRAM = 3
+
+
+class FrameIndex:
+  """
+    Prebuilt lookup of row positions for a DataFrame.
+
+    Row positions are grouped once for every combination of the key columns, so a filter on any
+    of those columns is answered by a dictionary lookup instead of masking (and copying) the whole frame.
+
+
+    Available methods:
+
+      (i) __init__(data : pd.DataFrame, keys : List) -> Reference of FrameIndex object
+
+      (ii) positions(**filters) -> np.ndarray (Row positions matching every given filter, in frame order)
+
+      (iii) take(**filters) -> pd.DataFrame (Rows matching every given filter)
+
+    Properties:
+      data : pd.DataFrame
+      keys : List
+  """
+
+  def __init__(self, data, keys):
+    self.data = data
+    self.keys = [key for key in keys if key in data.columns]
+    self._positions = {}
+
+    for size in range(1, len(self.keys) + 1):
+      for subset in combinations(self.keys, size):
+        by = list(subset) if size > 1 else subset[0]
+        self._positions[subset] = data.groupby(by, sort=False, observed=True).indices
+
+  def positions(self, **filters):
+    subset = tuple(key for key in self.keys if key in filters)
+    if len(subset) == 0:
+      return np.arange(len(self.data))
+
+    value = tuple(filters[key] for key in subset) if len(subset) > 1 else filters[subset[0]]
+
+    try:
+      return self._positions[subset].get(value, np.array([], dtype=np.intp))
+    except TypeError:
+      return np.array([], dtype=np.intp)
+
+  def take(self, **filters):
+    return self.data.iloc[self.positions(**filters)]
+
+
+def _frame_index(obj, keys):
+  """
+    The FrameIndex of obj.data, rebuilt if obj.data has been replaced since it was built.
+  """
+  if getattr(obj, '_index', None) is None or obj._index.data is not obj.data:
+    obj._index = FrameIndex(obj.data, keys)
+  return obj._index
+
+
+def _indexed_filter(obj, keys, college_code=None, branch_code=None, community=None):
+  """
+    Answers filter() for Round, RankList and SeatMatrix from the object's FrameIndex.
+
+    Filters follow the original semantics: a falsy value means the filter is not applied.
+  """
+  index = _frame_index(obj, keys)
+
+  filters = {}
+  if college_code:
+    filters['College Code'] = college_code
+  if branch_code:
+    filters['Branch Code'] = branch_code
+  if community and 'Allotted Community' in index.keys:
+    filters['Allotted Community'] = community
+
+  return index.take(**filters)
+
+
+class SearchIndex:
+  """
+    Prebuilt prefix and substring search over text columns of a DataFrame.
+
+    The distinct values of every column are converted to strings (and lowercased, unless the column is case sensitive)
+    once and sorted, so a prefix is found by binary search. Substrings are looked up in an index of the SEARCH_NGRAM
+    character grams of every distinct value, and only the values holding all grams of the text are checked.
+    Searches return row positions, so the frame is never rescanned or copied.
+
+
+    Available methods:
+
+      (i) __init__(data : pd.DataFrame, columns : List, case_sensitive=[] : List) -> Reference of SearchIndex object
+
+      (ii) startswith(column : str, text : str, within=None : np.ndarray) -> np.ndarray (Row positions whose value starts with text, in frame order)
+
+      (iii) contains(column : str, text : str, within=None : np.ndarray) -> np.ndarray (Row positions whose value contains text, in frame order)
+
+      (iv) take(positions=None : np.ndarray) -> pd.DataFrame (Rows at positions, or the whole frame)
+
+    Properties:
+      data : pd.DataFrame
+      columns : List
+      case_sensitive : List
+  """
+
+  def __init__(self, data, columns, case_sensitive=[]):
+    self.data = data
+    self.columns = [column for column in columns if column in data.columns]
+    self.case_sensitive = list(case_sensitive)
+    self._values = {}
+    self._rows = {}
+    self._grams = {}
+
+    for column in self.columns:
+      missing = data[column].isna().to_numpy()
+      text = data[column].astype(str)
+      if column not in self.case_sensitive:
+        text = text.str.lower()
+
+      values, codes = np.unique(text.to_numpy(dtype=str), return_inverse=True)
+      codes = np.where(missing, -1, codes.ravel())
+
+      order = np.argsort(codes, kind='stable')
+      bounds = np.searchsorted(codes[order], np.arange(len(values) + 1))
+
+      grams = {}
+      for i, value in enumerate(values):
+        for gram in {value[j:j + SEARCH_NGRAM] for j in range(len(value) - SEARCH_NGRAM + 1)}:
+          grams.setdefault(gram, []).append(i)
+
+      self._values[column] = values
+      self._rows[column] = [order[bounds[i]:bounds[i + 1]] for i in range(len(values))]
+      self._grams[column] = {gram : np.array(ids) for gram, ids in grams.items()}
+
+  def _normalize(self, column, text):
+    return str(text) if column in self.case_sensitive else str(text).lower()
+
+  def _positions(self, column, ids, within):
+    rows = self._rows[column]
+    positions = np.sort(np.concatenate([rows[i] for i in ids])) if len(ids) > 0 else np.array([], dtype=np.intp)
+
+    if within is not None:
+      positions = np.intersect1d(positions, within, assume_unique=True)
+
+    return positions
+
+  def startswith(self, column, text, within=None):
+    values = self._values[column]
+    text = self._normalize(column, text)
+
+    lo = np.searchsorted(values, text, side='left')
+    hi = np.searchsorted(values, text + chr(0x10FFFF), side='left')
+
+    return self._positions(column, range(lo, hi), within)
+
+  def contains(self, column, text, within=None):
+    values = self._values[column]
+    text = self._normalize(column, text)
+
+    if len(text) < SEARCH_NGRAM:
+      ids = np.flatnonzero(np.char.find(values, text) >= 0)
+    else:
+      grams = self._grams[column]
+      candidates = None
+
+      for gram in {text[j:j + SEARCH_NGRAM] for j in range(len(text) - SEARCH_NGRAM + 1)}:
+        if gram not in grams:
+          return self._positions(column, [], within)
+        candidates = grams[gram] if candidates is None else np.intersect1d(candidates, grams[gram], assume_unique=True)
+
+      ids = candidates[np.char.find(values[candidates], text) >= 0]
+
+    return self._positions(column, ids, within)
+
+  def take(self, positions=None):
+    return self.data if positions is None else self.data.iloc[positions]
+
+
+def _key_index(frame, keys):
+  """
+    Index built from the key columns of frame, matching the index of frame.groupby(keys).
+  """
+  if len(keys) == 1:
+    return pd.Index(frame[keys[0]])
+  return pd.MultiIndex.from_frame(frame[keys])
+
+
+_code_tables = {}
+_code_tables_lock = threading.Lock()
+
+
+def _encode_categories(data, columns=CATEGORY_COLUMNS):
+  """
+    Dictionary-encodes the given columns of data in place against the process-wide code tables.
+
+    Every Round, RankList and SeatMatrix shares one CategoricalDtype per column, so their frames are
+    concatenated, joined and grouped on the same integer codes. Categories are only ever appended,
+    so codes assigned earlier stay valid when a new round or seat matrix brings new values.
+    The tables are updated under a lock, as concurrent sessions may append categories at the same time.
+  """
+  for column in columns:
+    if column not in data.columns:
+      continue
+
+    values = data[column]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+      uniques = values.cat.categories
+    else:
+      uniques = pd.Index(values.dropna().unique())
+
+    with _code_tables_lock:
+      dtype = _code_tables.get(column)
+      if dtype is None:
+        dtype = pd.CategoricalDtype(uniques.astype(object))
+      elif not uniques.isin(dtype.categories).all():
+        dtype = pd.CategoricalDtype(dtype.categories.append(uniques[~uniques.isin(dtype.categories)].astype(object)))
+      _code_tables[column] = dtype
+
+    if values.dtype != dtype:
+      data[column] = values.astype(dtype)
+
+  return data
+
+
+def _compact_seats(data, columns=COMMUNITY_COLUMNS):
+  """
+    Stores the community seat columns of data as one int16 block, leaving them as they are if they hold missing or fractional values.
+  """
+  columns = [column for column in columns if column in data.columns]
+  seats = data[columns].apply(pd.to_numeric, errors='coerce')
+
+  if seats.notna().all().all() and (seats % 1 == 0).all().all():
+    data[columns] = seats.astype(np.int16)
+
+  return data
+
+
+def _decode_categories(frame):
+  """
+    frame with its categorical columns decoded back to plain values, as used by the report tables.
+
+    The shared code tables are in order of appearance, so sorting a report must not happen on the codes.
+  """
+  categorical = [column for column in frame.columns if isinstance(frame[column].dtype, pd.CategoricalDtype)]
+  if len(categorical) == 0:
+    return frame
+  return frame.astype({column : object for column in categorical})
+
+
+def _group_frame(frame, keys):
+  """
+    Distinct non-null rows of the key columns of frame, ordered like frame.groupby(keys).size().index.
+  """
+  val = _decode_categories(frame[keys].dropna().drop_duplicates())
+  return val.sort_values(keys, kind='stable', ignore_index=True)
+
+
+def _to_excel(frame, path):
+  """
+    Writes frame to the Excel file at path, timed as a stage of the active Instrumentation.Run.
+  """
+  with Instrumentation.stage(f'Writing {os.path.normpath(path)}'):
+    frame.to_excel(path, index=False)
+
+
+def _lookup(stats, column, index):
+  """
+    Values of stats[column] for every key of index, NaN where the key (or the column) is absent.
+  """
+  if column not in stats.columns:
+    return np.full(len(index), np.nan)
+  return stats[column].reindex(index).to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+class AggregateCube:
+  """
+    Allotment statistics of every Round and of the RankList, aggregated once per
+    (College Code, Branch Code, Allotted Community) cell.
+
+    Every report is derived from the cube by rolling the cells up to the keys it needs,
+    so generating all reports costs one scan of the rounds and the RankList.
+
+
+    Available methods:
+
+      (i) __init__(rounds : List, rank_list : RankList) -> Reference of AggregateCube object
+
+      (ii) round_statistics(keys : List, community=None : str) -> pd.DataFrame (Indexed by keys, with (statistic, round name) columns)
+
+      (iii) rank_list_statistics(keys : List, community=None : str) -> pd.DataFrame (Indexed by keys, with one column per statistic)
+
+      (iv) add_round(round : Round, rank_list : RankList) -> None (Adds the contribution of a newly published round)
+
+      Statistics: 'count', 'min', 'max' and 'mean' of Cutoff Mark, 'rank_min' and 'rank_max' of Rank.
+
+    Properties:
+      round_names : List
+      rounds : pd.DataFrame (Cells of every round, indexed by Round and the cell keys)
+      rank_list : pd.DataFrame (Cells of the RankList, indexed by the cell keys)
+  """
+
+  keys = ['College Code', 'Branch Code', 'Allotted Community']
+
+  def __init__(self, rounds, rank_list):
+    self.round_names = [round.name for round in rounds]
+    cells = [self._aggregate(round.data) for round in rounds] or [self._aggregate(rank_list.data.iloc[:0])]
+    self.rounds = pd.concat(cells, keys=self.round_names or [None], names=['Round'])
+    self.rank_list = self._aggregate(rank_list.data)
+    self._rollups = {}
+
+  def add_round(self, round, rank_list):
+    """
+      Adds a newly published round to the cube, touching only the cells of that round.
+
+      The round's cells are appended, round rollups gain the new round's columns, and the RankList cells
+      are updated for the candidates the round adds or moves. The result matches AggregateCube(rounds + [round], rank_list)
+      built after the round is added to the RankList.
+
+      Parameters:
+        (i) round : Round           =>   The newly published round.
+        (ii) rank_list : RankList   =>   The RankList *before* round is added to it.
+    """
+    cells = pd.concat([self._aggregate(round.data)], keys=[round.name], names=['Round'])
+
+    self.rounds = pd.concat([self.rounds, cells]) if len(self.round_names) > 0 else cells
+    self.round_names.append(round.name)
+
+    for (source, keys), stats in list(self._rollups.items()):
+      if source == 'rounds':
+        self._rollups[(source, keys)] = pd.concat([stats, self._rollup(cells, ['Round'] + list(keys)).unstack('Round')], axis=1)
+      else:
+        del self._rollups[(source, keys)]
+
+    new = round.data.drop_duplicates(subset=['Rank Key'], keep='last')
+    new_keys = new['Rank Key'].to_numpy()
+    keys = rank_list.data['Rank Key'].to_numpy()
+
+    positions = np.searchsorted(keys, new_keys)
+    found = positions < len(keys)
+    found[found] = keys[positions[found]] == new_keys[found]
+    displaced = rank_list.data.iloc[positions[found]]
+
+    removed = self._aggregate(displaced)
+    added = self._aggregate(new)
+    cells = self.rank_list.reindex(self.rank_list.index.union(added.index))
+
+    for column in ['count', 'cutoff_count', 'cutoff_sum']:
+      cells[column] = cells[column].fillna(0) - removed[column].reindex(cells.index, fill_value=0) + added[column].reindex(cells.index, fill_value=0)
+
+    for column in ['cutoff_min', 'rank_min']:
+      cells[column] = pd.concat([cells[column], added[column]], axis=1).min(axis=1)
+    for column in ['cutoff_max', 'rank_max']:
+      cells[column] = pd.concat([cells[column], added[column]], axis=1).max(axis=1)
+
+    if len(removed) > 0:
+      rows = [new[_key_index(new, self.keys).isin(removed.index)]]
+      for cell in removed.index:
+        members = rank_list.data.iloc[self._cell_positions(rank_list, cell)]
+        rows.append(members[~members['Rank Key'].isin(new['Rank Key'])])
+
+      recomputed = self._aggregate(pd.concat(rows, ignore_index=True)).reindex(removed.index)
+      for column in ['cutoff_min', 'cutoff_max', 'rank_min', 'rank_max']:
+        cells.loc[removed.index, column] = recomputed[column]
+
+    for column in ['count', 'cutoff_count']:
+      cells[column] = cells[column].astype(np.int64)
+
+    self.rank_list = cells[cells['count'] > 0]
+
+  @classmethod
+  def _cell_positions(cls, obj, cell):
+    if any(pd.isna(value) for value in cell):
+      return np.flatnonzero(np.logical_and.reduce([
+          obj.data[key].isna().to_numpy() if pd.isna(value) else (obj.data[key] == value).to_numpy() for key, value in zip(cls.keys, cell)
+      ]))
+
+    return _frame_index(obj, INDEX_KEYS).positions(**dict(zip(cls.keys, cell)))
+
+  @classmethod
+  def _aggregate(cls, frame):
+    frame = frame.assign(**{'Cutoff Mark' : frame['Cutoff Mark'].astype(np.float64)})
+
+    return frame.groupby(cls.keys, observed=True, dropna=False).agg(
+        count=('Cutoff Mark', 'size'),
+        cutoff_count=('Cutoff Mark', 'count'),
+        cutoff_sum=('Cutoff Mark', 'sum'),
+        cutoff_min=('Cutoff Mark', 'min'),
+        cutoff_max=('Cutoff Mark', 'max'),
+        rank_min=('Rank', 'min'),
+        rank_max=('Rank', 'max')
+    )
+
+  @staticmethod
+  def _rollup(cells, keys):
+    stats = cells.reset_index().groupby(keys, observed=True, dropna=False).agg(
+        count=('count', 'sum'),
+        cutoff_count=('cutoff_count', 'sum'),
+        cutoff_sum=('cutoff_sum', 'sum'),
+        min=('cutoff_min', 'min'),
+        max=('cutoff_max', 'max'),
+        rank_min=('rank_min', 'min'),
+        rank_max=('rank_max', 'max')
+    )
+    stats['mean'] = stats['cutoff_sum'] / stats['cutoff_count'].where(stats['cutoff_count'] > 0)
+
+    return stats.drop(columns=['cutoff_count', 'cutoff_sum'])
+
+  @staticmethod
+  def _community(stats, community):
+    if community == None:
+      return stats
+    return stats[stats.index.get_level_values('Allotted Community') == community].droplevel('Allotted Community')
+
+  def round_statistics(self, keys, community=None):
+    keys = keys + (['Allotted Community'] if community != None else [])
+
+    if ('rounds', tuple(keys)) not in self._rollups:
+      self._rollups[('rounds', tuple(keys))] = self._rollup(self.rounds, ['Round'] + keys).unstack('Round')
+
+    return self._community(self._rollups[('rounds', tuple(keys))], community)
+
+  def rank_list_statistics(self, keys, community=None):
+    keys = keys + (['Allotted Community'] if community != None else [])
+
+    if ('rank_list', tuple(keys)) not in self._rollups:
+      self._rollups[('rank_list', tuple(keys))] = self._rollup(self.rank_list, keys)
+
+    return self._community(self._rollups[('rank_list', tuple(keys))], community)
+
 
 class Round:
   """
@@ -12,56 +464,89 @@ class Round:
   def __init__(self, excel_path, round_name: str, rename_dict=None):
     """
       Constructor of class Round.
+
+      The cleaned data is cached next to the inputs (see Cache.py), keyed by the content hash of excel_path
+      and rename_dict, and loaded from the cache instead of parsing the Excel file when it is valid.
     """
+    self.name = round_name
 
-    self.data = pd.read_excel(excel_path, engine='openpyxl')
+    cache = Cache.source_cache_path('Round', excel_path, rename_dict)
+    self.data = Cache.read_frame(cache)
 
-    if rename_dict != None:
-      self.rename_columns(rename_dict)
+    if self.data is None:
+      self.data = self._read_excel(excel_path, rename_dict)
 
-    self.data.drop(columns=['Community', 'Name', 'Serial Number', 'Application Number', 'DOB'], inplace=True)
-    self.name = round_name
+      if rename_dict != None:
+        self.rename_columns(rename_dict)
+
+      self._fix_alphabetical_ranks()
+      self.data.sort_values(by='Rank Key', kind='stable', ignore_index=True, inplace=True)
+
+      Cache.write_frame(self.data, cache)
 
-    self._fix_alphabetical_ranks()
-    self.data.sort_values(by='Rank', ignore_index=True, inplace=True)
+    _encode_categories(self.data)
+    self._index = FrameIndex(self.data, INDEX_KEYS)
 
   def rename_columns(self, rename_dict):
     self.data = self.data.rename(columns=rename_dict)
 
+  @staticmethod
+  def _read_excel(excel_path, rename_dict=None):
+    """
+      Reads only the columns of ROUND_DTYPES (matched after applying rename_dict) with their compact dtypes,
+      so personal data such as Name, DOB and Application Number is never loaded into the DataFrame.
+    """
+    if rename_dict == None:
+      rename_dict = {}
+
+    dtype = dict(ROUND_DTYPES)
+    for column, target in rename_dict.items():
+      if target in ROUND_DTYPES:
+        dtype[column] = ROUND_DTYPES[target]
+
+    usecols = lambda column : rename_dict.get(column, column) in ROUND_DTYPES
+
+    try:
+      return pd.read_excel(excel_path, engine='openpyxl', usecols=usecols, dtype=dtype)
+    except (ValueError, TypeError):
+      print(f'Could not apply compact dtypes while reading {excel_path}, reading with inferred dtypes...')
+      return pd.read_excel(excel_path, engine='openpyxl', usecols=usecols)
+
   def _fix_alphabetical_ranks(self):
-    ranks = list(self.data['Rank'].copy())
-    new_ranks = []
+    """
+      Normalizes the Rank column, which may hold alphabetical ranks such as '1234A' for tied candidates.
 
-    for rank in ranks:
-      try:
-        new_ranks.append(int(rank))
-      except ValueError:
-        try:
-          rank_val = int("".join([x for x in list(str(rank)) if x.isdigit()]))
-          if rank_val in new_ranks:
-            new_ranks.append(float(rank_val) + (new_ranks.count(rank_val)/10))
-          else:
-            new_ranks.append(rank_val)
-        except:
-          new_ranks.append(math.inf)
+      'Rank' becomes the integer base rank (digits of the label, <NA> when it has none), and 'Rank Key'
+      a sortable int64 key: base rank * RANK_TIE_SLOTS + tie number. The tie number is derived from the
+      letters of the label alone (0 for a plain integer, A -> 1, B -> 2, ..., AA -> 28), so the same label
+      gets the same key in every round and '1234' sorts before '1234A' and '1234B'.
+      Ranks without any digit get UNRANKED_KEY and sort last.
+    """
+    ranks = self.data['Rank']
+
+    numeric = pd.to_numeric(ranks, errors='coerce')
+    numeric = np.trunc(numeric.where(np.isfinite(numeric)))
+
+    alphabetical = numeric.isna()
+    labels = ranks[alphabetical].astype(str)
+    digits = labels.str.replace(r'\D', '', regex=True)
+    base = numeric.fillna(pd.to_numeric(digits, errors='coerce')).astype('Int64')
+
+    ordinal = pd.Series(0, index=ranks.index, dtype=np.int64)
+    letters = labels.str.upper().str.replace(r'[^A-Z]', '', regex=True)
+    for position in range(2):
+      letter = letters.str[-(position + 1)].fillna('@').map(ord).astype(np.int64) - ord('@')
+      ordinal[alphabetical] += letter.to_numpy() * 27 ** position
 
-    self.data['Rank'] = new_ranks
+    self.data['Rank'] = base
+    self.data['Rank Key'] = (base * RANK_TIE_SLOTS + ordinal).fillna(UNRANKED_KEY).astype(np.int64)
 
   def filter(self, college_code=None, branch_code=None, community=None):
     if college_code == None and branch_code == None and community == None:
       print('No Filter Applied to RankList Data...')
       return self.data.copy()
 
-    filtered = self.data.copy()
-
-    if college_code:
-      filtered = filtered[filtered['College Code'] == college_code]
-    if branch_code:
-      filtered = filtered[filtered['Branch Code'] == branch_code]
-    if community:
-      filtered = filtered[filtered['Allotted Community'] == community]
-
-    return filtered
+    return _indexed_filter(self, INDEX_KEYS, college_code=college_code, branch_code=branch_code, community=community)
 
 
 class RankList:
@@ -79,6 +564,8 @@ class RankList:
 
       (ii) filter(college_code=None : int, branch_code=None : str, community=None : str) -> pd.DataFrame (the Filtered RankList for according to the corresponding filters)
 
+      (iii) add_round(round : Round) -> None (Merges a newly published round into the RankList)
+
     Properties:
       data : pd.DataFrame
 
@@ -94,11 +581,38 @@ class RankList:
       Return:
         Returns the reference of created RankList Object internally.
     """
-    self.data = pd.DataFrame()
-    for round in rounds:
-      self.data = pd.concat([self.data, round.data.copy()], ignore_index=True)
-    self.data.drop_duplicates(subset=['Rank'], keep='last', inplace=True)
-    self.data.sort_values(by='Rank', inplace=True, ignore_index=True)
+    self.data = pd.concat([_encode_categories(round.data) for round in rounds], ignore_index=True)
+    self.data.drop_duplicates(subset=['Rank Key'], keep='last', inplace=True)
+    self.data.sort_values(by='Rank Key', kind='stable', inplace=True, ignore_index=True)
+    self._index = FrameIndex(self.data, INDEX_KEYS)
+
+  def add_round(self, round):
+    """
+      Merges a newly published round into the RankList without rebuilding it.
+
+      Candidates of the new round replace their earlier allotments (last wins on 'Rank Key'), and the
+      round is merged into the already sorted RankList, giving the same result as RankList(rounds + [round]).
+
+      Parameters:
+        (i) round : Round   =>   The round to be added.
+    """
+    _encode_categories(self.data)
+
+    new = _encode_categories(round.data)
+    if not new['Rank Key'].is_monotonic_increasing:
+      new = new.sort_values(by='Rank Key', kind='stable')
+    new = new.drop_duplicates(subset=['Rank Key'], keep='last')
+
+    old = self.data[~self.data['Rank Key'].isin(new['Rank Key'])]
+
+    old_keys = old['Rank Key'].to_numpy()
+    new_keys = new['Rank Key'].to_numpy()
+
+    order = np.empty(len(old_keys) + len(new_keys), dtype=np.intp)
+    order[np.arange(len(old_keys)) + np.searchsorted(new_keys, old_keys)] = np.arange(len(old_keys))
+    order[np.arange(len(new_keys)) + np.searchsorted(old_keys, new_keys)] = np.arange(len(new_keys)) + len(old_keys)
+
+    self.data = pd.concat([old, new], ignore_index=True).take(order).reset_index(drop=True)
 
   def filter(self, college_code=None, branch_code=None, community=None):
     """
@@ -120,29 +634,134 @@ class RankList:
       print('No Filter Applied to RankList Data...')
       return self.data.copy()
 
-    filtered = self.data.copy()
+    return _indexed_filter(self, INDEX_KEYS, college_code=college_code, branch_code=branch_code, community=community)
 
-    if college_code:
-      filtered = filtered[filtered['College Code'] == college_code]
-    if branch_code:
-      filtered = filtered[filtered['Branch Code'] == branch_code]
-    if community:
-      filtered = filtered[filtered['Allotted Community'] == community]
 
-    return filtered
+class SeatLedger:
+  """
+    Tracks the Remaining and Filled seats of a SeatMatrix round by round.
+
+    Seats are held in a (branch x community) integer matrix keyed by College Code and Branch Code.
+    Each round is applied as one scatter-add of its allotments, and a snapshot is kept after every round.
+
+
+    Available methods:
+
+      (i) __init__(seat_matrix : SeatMatrix) -> Reference of SeatLedger object
+
+      (ii) apply(round : Round) -> None (Adds the allotments of the round to the Filled seats)
+
+      (iii) frame(step : int, kind='Remaining' : str) -> pd.DataFrame (Remaining or Filled seats after the given step, 0 being before any round)
+
+      (iv) to_excel(path='' : str, steps=None : List) -> None (Writes the snapshots of the given steps, all by default, to ./path/SeatMatrix/Remaining and ./path/SeatMatrix/Filled)
+
+      (v) written(path='' : str) -> bool (Whether the snapshots of every step were last written to path and are still there)
+
+    Properties:
+      round_names : List
+      path : str (Path the snapshots were last written to, None before any)
+      available : np.ndarray (branch x community)
+      filled : np.ndarray (step x branch x community)
+      remaining : np.ndarray (step x branch x community)
+  """
+
+  communities = ['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']
+  key_columns = ['College Code', 'College Name', 'Branch Code', 'Branch Name']
+
+  def __init__(self, seat_matrix):
+    self.keys = seat_matrix.data[self.key_columns].reset_index(drop=True)
+    self.available = seat_matrix.data[self.communities].to_numpy()
+
+    index = _key_index(self.keys, ['College Code', 'Branch Code'])
+    self._branches = index.unique()
+    self._rows = self._branches.get_indexer(index)
+
+    self.round_names = []
+    self._filled = [np.zeros((len(self._branches), len(self.communities)), dtype=np.int64)]
+    self.path = None
+
+  def apply(self, round):
+    branches = self._branches.get_indexer(_key_index(round.data, ['College Code', 'Branch Code']))
+    communities = pd.Index(self.communities).get_indexer(round.data['Allotted Community'])
+    allotted = (branches >= 0) & (communities >= 0)
+
+    filled = self._filled[-1].copy()
+    np.add.at(filled, (branches[allotted], communities[allotted]), 1)
+
+    self._filled.append(filled)
+    self.round_names.append(round.name)
+
+  @property
+  def filled(self):
+    return np.stack(self._filled)[:, self._rows, :]
+
+  @property
+  def remaining(self):
+    return self.available[np.newaxis, :, :] - self.filled
+
+  def frame(self, step, kind='Remaining'):
+    filled = self._filled[step][self._rows]
+    values = self.available - filled if kind == 'Remaining' else filled
+
+    return pd.concat([self.keys, pd.DataFrame(values, columns=self.communities)], axis=1)
+
+  def _file(self, path, step, kind):
+    name = 'Before Round(s)' if step == 0 else f'{kind} After {self.round_names[step - 1]}'
+    return f'./{path}/SeatMatrix/{kind}/{name}.xlsx'
+
+  def written(self, path=''):
+    if self.path != path:
+      return False
+
+    return all(os.path.exists(self._file(path, step, kind)) for step in range(len(self._filled)) for kind in ['Remaining', 'Filled'])
+
+  def to_excel(self, path='', steps=None):
+    os.makedirs(f'./{path}/SeatMatrix/Remaining', exist_ok=True)
+    os.makedirs(f'./{path}/SeatMatrix/Filled', exist_ok=True)
+
+    if steps == None:
+      steps = range(len(self._filled))
+
+    for step in steps:
+      for kind in ['Remaining', 'Filled']:
+        _to_excel(self.frame(step, kind), self._file(path, step, kind))
+
+    self.path = path
 
 
 class SeatMatrix:
+  names = {'College Code' : 'College Name', 'Branch Code' : 'Branch Name'}
+
   def __init__(self, excel_path: str, rename_dict=None):
-    self.data = pd.read_excel(excel_path, engine='openpyxl')
+    cache = Cache.source_cache_path('SeatMatrix', excel_path, rename_dict)
+    self.data = Cache.read_frame(cache)
 
-    if rename_dict != None:
-      self.data = self.data.rename(columns=rename_dict)
+    if self.data is None:
+      self.data = pd.read_excel(excel_path, engine='openpyxl')
 
-    self._remove_carriage_return('College Name', 'Branch Name')
+      if rename_dict != None:
+        self.data = self.data.rename(columns=rename_dict)
 
-  @staticmethod
-  def cast(df):
+      self._remove_carriage_return('College Name', 'Branch Name')
+
+      Cache.write_frame(self.data, cache)
+
+    _encode_categories(self.data)
+    _compact_seats(self.data)
+    self._index = FrameIndex(self.data, INDEX_KEYS)
+
+  @classmethod
+  def from_frame(cls, df, rename_dict=None):
+    """
+      Builds a SeatMatrix directly from a DataFrame, without writing it to disk.
+
+      Parameters:
+        (i) df : pd.DataFrame      =>   SeatMatrix data with the standard columns.
+        (ii) rename_dict : dict    =>   Optional mapping applied to the column names before validation.
+
+      Return:
+        SeatMatrix   =>   A new SeatMatrix holding a copy of the standard columns of df, or None if df is not valid.
+    """
     std_columns = ['College Code',
                    'College Name',
                    'Branch Code',
@@ -161,27 +780,36 @@ class SeatMatrix:
           return False
       return True
 
-    if type(df) == pd.DataFrame:
-      if _checkcols(list(df.columns), std_columns):
-        df.to_excel('temp.xlsx', index=False)
-        result = SeatMatrix('temp.xlsx')
-        result.data = result.data[std_columns]
-        import os
-        os.remove('temp.xlsx')
-        result._remove_carriage_return('College Name', 'Branch Name')
-        return result
-      else:
-        print(f'Standard columns:\t{std_columns}\nwere not present in DataFrame object.')
-        return None
-    else:
+    if type(df) != pd.DataFrame:
       print('The given data was not of type pd.DataFrame( ).')
       return None
 
+    if rename_dict != None:
+      df = df.rename(columns=rename_dict)
+
+    if not _checkcols(list(df.columns), std_columns):
+      print(f'Standard columns:\t{std_columns}\nwere not present in DataFrame object.')
+      return None
+
+    result = cls.__new__(cls)
+    result.data = df[std_columns].reset_index(drop=True)
+    result._remove_carriage_return('College Name', 'Branch Name')
+    _encode_categories(result.data)
+    _compact_seats(result.data)
+    result._index = FrameIndex(result.data, INDEX_KEYS)
+    return result
+
+  @staticmethod
+  def cast(df):
+    return SeatMatrix.from_frame(df)
 
   def _remove_carriage_return(self, *columns):
     for column in columns:
       if self.data[column].dtype == object:
         self.data[column] = self.data[column].str.replace('\r', '').replace('\n', '')
+      elif isinstance(self.data[column].dtype, pd.CategoricalDtype):
+        # Already encoded from a cleaned SeatMatrix (e.g. the result of __add__ or __sub__)
+        continue
       else:
         print(f'Column {column} is not of type object.')
 
@@ -207,75 +835,182 @@ class SeatMatrix:
     print('The second object is not of type SeatMatrix')
     return None
 
-  def evaluate_rounds_sm(self, rounds, path=''):
-    filled = self - self
-    rem = SeatMatrix.cast(self.data.copy())
+  def total_seats(self, keys, communities=None):
+    """
+      Total seats of every group of keys, summed over the community columns.
 
-    os.makedirs(f'./{path}/SeatMatrix/Remaining', exist_ok=True)
-    os.makedirs(f'./{path}/SeatMatrix/Filled', exist_ok=True)
+      Parameters:
+        (i) keys : List           =>   Columns identifying a group (e.g. College Code and Branch Code).
+        (ii) communities : List   =>   Community columns to be summed, all of them by default.
 
-    rem.data.to_excel(f'./{path}/SeatMatrix/Remaining/Before Round(s).xlsx', index=False)
-    filled.data.to_excel(f'./{path}/SeatMatrix/Filled/Before Round(s).xlsx', index=False)
+      Return:
+        pd.Series   =>   Total seats indexed by keys.
+    """
+    if communities == None:
+      communities = COMMUNITY_COLUMNS
 
-    for round in rounds:
-      round_filled = SeatMatrix.cast(self.data.groupby(['College Code', 'College Name', 'Branch Code', 'Branch Name']).apply(
-          lambda group: (
-              group.assign(
-                  OC=(len(round.filter(community='OC', college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0]))),
-                  BC=(len(round.filter(community='BC', college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0]))),
-                  BCM=(len(round.filter(community='BCM', college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0]))),
-                  MBC=(len(round.filter(community='MBC', college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0]))),
-                  SC=(len(round.filter(community='SC', college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0]))),
-                  SCA=(len(round.filter(community='SCA', college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0]))),
-                  ST=(len(round.filter(community='ST', college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])))
-              )
-          )
-      ).reset_index(drop=True))
-
-      rem -= round_filled
-      filled += round_filled
-
-      rem.data.to_excel(f'./{path}/SeatMatrix/Remaining/Remaining After {round.name}.xlsx', index=False)
-      filled.data.to_excel(f'./{path}/SeatMatrix/Filled/Filled After {round.name}.xlsx', index=False)
+    return self.data.groupby(keys, observed=True)[communities].sum().sum(axis=1).astype(np.int64).rename('Total')
 
-    return None
+  def totals(self, keys, communities=None):
+    """
+      Total seats of every group of keys, with the name of every key (College Name of College Code, Branch Name of Branch Code).
+
+      Return:
+        pd.DataFrame   =>   The keys, their names and 'Total', one row per group, ordered by the keys.
+    """
+    columns = [column for key in keys for column in [key, self.names.get(key)] if column in self.data.columns]
+
+    val = _group_frame(self.data, columns).drop_duplicates(subset=keys, ignore_index=True)
+    val['Total'] = self.total_seats(keys, communities).reindex(_key_index(val, keys)).to_numpy()
+    return val
 
-  def evaluate_rounds_roundwise_collegewise(self, rounds, rank_list, cum=None, high_low_mean=None, by_filled=True, path=''):
+  def total_collegewise(self):
+    """
+      Total seats of every college.
 
+      Return:
+        pd.DataFrame   =>   'College Code', 'College Name' and 'Total', one row per College Code, ordered by College Code.
+    """
+    return self.totals(['College Code'])
+
+  def total_collegebranch(self):
+    """
+      Total seats of every branch of every college.
+
+      Return:
+        pd.DataFrame   =>   'College Code', 'College Name', 'Branch Code', 'Branch Name' and 'Total', one row per College Code and Branch Code, ordered by them.
+    """
+    return self.totals(['College Code', 'Branch Code'])
+
+  def diff(self, other, keys=None, community=None):
+    """
+      Compares the seats of this SeatMatrix (year N-1) with those of other (year N) in one outer merge on keys.
+
+      Groups only in this SeatMatrix are 'Removed' (N is 0), groups only in other are 'Added' (N-1 is 0),
+      and names are taken from other where present.
+
+      Parameters:
+        (i) other : SeatMatrix   =>   SeatMatrix of the following year.
+        (ii) keys : List         =>   Granularity of the comparison, ['College Code'] (by default) or ['College Code', 'Branch Code'].
+        (iii) community : str    =>   Compares the seats of one community instead of the total seats.
+
+      Return:
+        pd.DataFrame   =>   The keys, their names, 'N-1', 'N', 'Difference' and 'Status' ('Common', 'Added' or 'Removed'), ordered by the keys.
+    """
+    if keys == None:
+      keys = ['College Code']
+
+    communities = [community] if community != None else None
+
+    merged = pd.merge(self.totals(keys, communities), other.totals(keys, communities), on=keys, how='outer', suffixes=(' N-1', ' N'), indicator=True)
+
+    val = merged[keys].copy()
+    for key in keys:
+      name = self.names.get(key)
+      if f'{name} N' in merged.columns:
+        val.insert(val.columns.get_loc(key) + 1, name, merged[f'{name} N'].fillna(merged[f'{name} N-1']))
+
+    val['N-1'] = merged['Total N-1'].fillna(0).astype(np.int64)
+    val['N'] = merged['Total N'].fillna(0).astype(np.int64)
+    val['Difference'] = val['N'] - val['N-1']
+    val['Status'] = merged['_merge'].map({'both' : 'Common', 'left_only' : 'Removed', 'right_only' : 'Added'}).astype(object)
+
+    return val.sort_values(by=keys, kind='stable', ignore_index=True)
+
+  def evaluate_rounds_sm(self, rounds, path='', ledger=None):
     round_names = [round.name for round in rounds]
-    if high_low_mean == True:
-      temp = [[f'{names}', f'{names} Filled %', f'{names} Lowest Cutoff', f'{names} Highest Cutoff', f'{names} Average Cutoff'] for names in round_names]
+
+    if ledger is None or ledger.round_names != round_names[:len(ledger.round_names)]:
+      ledger = SeatLedger(self)
+
+    # Only the snapshots of new rounds need writing, unless the earlier ones are not (or no longer) at path.
+    first = len(ledger.round_names) + 1 if len(ledger.round_names) > 0 and ledger.written(path) else 0
+
+    for round in rounds[len(ledger.round_names):]:
+      ledger.apply(round)
+
+    ledger.to_excel(path, steps=range(first, len(ledger.round_names) + 1))
+
+    return ledger
+
+  def _roundwise_table(self, rounds, rank_list, group_keys, keys, high_low_mean=None, by_filled=True, community=None, cube=None):
+    """
+      Builds the round-wise filling table used by the evaluate_rounds_roundwise_* methods.
+
+      Parameters:
+        (i) group_keys : List   =>   SeatMatrix columns identifying a row of the table (e.g. College Code and College Name).
+        (ii) keys : List        =>   Columns the allotments are counted by (e.g. College Code).
+        (iii) community : str   =>   Restricts the table to the allotments and seats of one community.
+        (iv) cube : AggregateCube   =>   Precomputed statistics of rounds and rank_list, built here when not given.
+
+      Return:
+        pd.DataFrame   =>   One row per group with the Round, Filled % (and Cutoff) columns and 'Total_Available'.
+    """
+    communities = ['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']
+
+    if cube is None:
+      cube = AggregateCube(rounds, rank_list)
+
+    val = _group_frame(self.data, group_keys)
+    index = _key_index(val, keys)
+
+    if community:
+      available = self.data.drop_duplicates(subset=keys, keep='last').set_index(keys)[community].reindex(index).to_numpy()
     else:
-      temp = [[f'{names}', f'{names} Filled %'] for names in round_names]
-    round_std = [j for i in temp for j in i]
+      available = self.data.groupby(keys, observed=True)[communities].sum().sum(axis=1).reindex(index).to_numpy()
 
-    round_std = ['College Code', 'College Name'] + round_std + ['Total Available' ,'Total Filled', 'Total % Filled']
+    stats = cube.round_statistics(keys, community=community)
+
+    if by_filled:
+      denominator = cube.rank_list_statistics(keys, community=community)['count'].reindex(index, fill_value=0).to_numpy()
+    else:
+      denominator = available
+
+    counts, cutoffs = self._round_lookups(rounds, stats, index, high_low_mean)
+
+    return pd.concat([val, pd.DataFrame(self._roundwise_columns(rounds, counts, cutoffs, available, denominator))], axis=1)
+
+  @staticmethod
+  def _round_lookups(rounds, stats, index, high_low_mean=None):
+    """
+      Allotment counts (and Lowest, Highest and Average Cutoffs) of every round for every key of index, read from round statistics of an AggregateCube.
+    """
+    counts = {round.name : np.nan_to_num(_lookup(stats, ('count', round.name), index)).astype(np.int64) for round in rounds}
 
+    cutoffs = {}
     if high_low_mean == True:
-      val = self.data.drop(columns=['Branch Name', 'Branch Code', 'OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']).groupby(['College Code', 'College Name']).apply(
-                lambda group : (group.assign(
-                        **{x.name : (len(x.filter(college_code=group['College Code'].iloc[0]))) for x in rounds},
-                        Total_Available = self.filter(college_code=group['College Code'].iloc[0])[['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']].sum().sum(),
-                        **{f'{x.name} Filled %' : 0 if (temp := (len(rank_list.filter(college_code=group['College Code'].iloc[0])) if by_filled else self.filter(college_code=group['College Code'].iloc[0])[['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']].sum().sum())) == 0 else ((len(x.filter(college_code=group['College Code'].iloc[0])) / temp)*100) for x in rounds},
-                        TEMP1 = 0,
-                        **{f'{x.name} Lowest Cutoff' : 0 if len(temp := x.filter(college_code=group['College Code'].iloc[0])) == 0 else temp['Cutoff Mark'].min() for x in rounds},
-                        TEMP2 = 0,
-                        **{f'{x.name} Highest Cutoff' : 0 if len(temp := x.filter(college_code=group['College Code'].iloc[0])) == 0 else temp['Cutoff Mark'].max() for x in rounds},
-                        TEMP3 = 0,
-                        **{f'{x.name} Average Cutoff' : 0 if len(temp := x.filter(college_code=group['College Code'].iloc[0])) == 0 else temp['Cutoff Mark'].mean() for x in rounds}
+      for statistic, label in [('min', 'Lowest'), ('max', 'Highest'), ('mean', 'Average')]:
+        for round in rounds:
+          cutoffs[f'{round.name} {label} Cutoff'] = np.where(counts[round.name] == 0, 0, _lookup(stats, (statistic, round.name), index))
+
+    return counts, cutoffs
+
+  @staticmethod
+  def _roundwise_columns(rounds, counts, cutoffs, available, denominator):
+    columns = {}
+    for round in rounds:
+      count = counts[round.name]
+      columns[round.name] = count
+      with np.errstate(divide='ignore', invalid='ignore'):
+        columns[f'{round.name} Filled %'] = np.where(denominator == 0, 0, (count / denominator) * 100)
+
+    columns['Total_Available'] = available
+    columns.update(cutoffs)
 
-            ))).drop(columns=['College Code', 'College Name', 'TEMP1', 'TEMP2', 'TEMP3']).reset_index(level=[2], drop=True).reset_index().drop_duplicates().reset_index(drop=True)
+    return columns
 
+  def evaluate_rounds_roundwise_collegewise(self, rounds, rank_list, cum=None, high_low_mean=None, by_filled=True, path='', cube=None):
 
+    round_names = [round.name for round in rounds]
+    if high_low_mean == True:
+      temp = [[f'{names}', f'{names} Filled %', f'{names} Lowest Cutoff', f'{names} Highest Cutoff', f'{names} Average Cutoff'] for names in round_names]
     else:
-      val = self.data.drop(columns=['Branch Name', 'Branch Code', 'OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']).groupby(['College Code', 'College Name']).apply(
-          lambda group : (group.assign(
-                  **{x.name : (len(x.filter(college_code=group['College Code'].iloc[0]))) for x in rounds},
-                  Total_Available = self.filter(college_code=group['College Code'].iloc[0])[['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']].sum().sum(),
-                  **{f'{x.name} Filled %' : 0 if (temp := (len(rank_list.filter(college_code=group['College Code'].iloc[0])) if by_filled else self.filter(college_code=group['College Code'].iloc[0])[['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']].sum().sum())) == 0 else ((len(x.filter(college_code=group['College Code'].iloc[0])) / temp)*100) for x in rounds},
-          ))
-      ).drop(columns=['College Code', 'College Name']).reset_index(level=[2], drop=True).reset_index().drop_duplicates().reset_index(drop=True)
+      temp = [[f'{names}', f'{names} Filled %'] for names in round_names]
+    round_std = [j for i in temp for j in i]
 
+    round_std = ['College Code', 'College Name'] + round_std + ['Total Available' ,'Total Filled', 'Total % Filled']
+
+    val = self._roundwise_table(rounds, rank_list, ['College Code', 'College Name'], ['College Code'], high_low_mean=high_low_mean, by_filled=by_filled, cube=cube)
 
     val = val.rename(columns={'Total_Available' : 'Total Available'})
 
@@ -298,18 +1033,18 @@ class SeatMatrix:
     os.makedirs(path, exist_ok=True)
     if by_filled:
       if cum:
-        val.to_excel(path + '/College-wise Round-wise Filling - By Filled - Cumulative.xlsx', index=False)
+        _to_excel(val, path + '/College-wise Round-wise Filling - By Filled - Cumulative.xlsx')
       else:
-        val.to_excel(path + '/College-wise Round-wise Filling - By Filled - Non-Cumulative.xlsx', index=False)
+        _to_excel(val, path + '/College-wise Round-wise Filling - By Filled - Non-Cumulative.xlsx')
     else:
       if cum:
-        val.to_excel(path + '/College-wise Round-wise Filling - By Total - Cumulative.xlsx', index=False)
+        _to_excel(val, path + '/College-wise Round-wise Filling - By Total - Cumulative.xlsx')
       else:
-        val.to_excel(path + '/College-wise Round-wise Filling - By Total - Non-Cumulative.xlsx', index=False)
+        _to_excel(val, path + '/College-wise Round-wise Filling - By Total - Non-Cumulative.xlsx')
 
     return val
 
-  def evaluate_rounds_roundwise_collegewise_branchwise(self, rounds, rank_list, cum=None, high_low_mean=None, by_filled=True, path=''):
+  def evaluate_rounds_roundwise_collegewise_branchwise(self, rounds, rank_list, cum=None, high_low_mean=None, by_filled=True, path='', cube=None):
 
     round_names = [round.name for round in rounds]
     if high_low_mean == True:
@@ -321,31 +1056,7 @@ class SeatMatrix:
     round_std = ['College Code', 'College Name', 'Branch Code', 'Branch Name'] + round_std + ['Total Available' ,'Total Filled', 'Total % Filled']
 
 
-    if high_low_mean == True:
-      val = self.data.drop(columns=['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']).groupby(['College Code', 'College Name', 'Branch Code', 'Branch Name']).apply(
-          lambda group : (group.assign(
-                  **{x.name : (len(x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0]))) for x in rounds},
-                  Total_Available = self.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])[['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']].sum().sum(),
-                  **{f'{x.name} Filled %' : 0 if (temp := (len(rank_list.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])) if by_filled else self.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])[['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']].sum().sum())) == 0 else ((len(x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])) / temp)*100) for x in rounds},
-                  TEMP1 = 0,
-                  **{f'{x.name} Lowest Cutoff' : 0 if len(temp := x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])) == 0 else temp['Cutoff Mark'].min() for x in rounds},
-                  TEMP2 = 0,
-                  **{f'{x.name} Highest Cutoff' : 0 if len(temp := x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])) == 0 else temp['Cutoff Mark'].max() for x in rounds},
-                  TEMP3 = 0,
-                  **{f'{x.name} Average Cutoff' : 0 if len(temp := x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])) == 0 else temp['Cutoff Mark'].mean() for x in rounds}
-          ))
-      ).drop(columns=['College Code', 'College Name', 'Branch Code', 'Branch Name', 'TEMP1', 'TEMP2', 'TEMP3']).reset_index(level=[4], drop=True).reset_index().drop_duplicates().reset_index(drop=True)
-
-    else:
-      val = self.data.drop(columns=['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']).groupby(['College Code', 'College Name', 'Branch Code', 'Branch Name']).apply(
-          lambda group : (group.assign(
-                  **{x.name : (len(x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0]))) for x in rounds},
-                  Total_Available = self.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])[['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']].sum().sum(),
-                  **{f'{x.name} Filled %' : 0 if (temp := (len(rank_list.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])) if by_filled else self.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])[['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']].sum().sum())) == 0 else ((len(x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])) / temp)*100) for x in rounds}
-          ))
-      ).drop(columns=['College Code', 'College Name', 'Branch Code', 'Branch Name']).reset_index(level=[4], drop=True).reset_index().drop_duplicates().reset_index(drop=True)
-
-
+    val = self._roundwise_table(rounds, rank_list, ['College Code', 'College Name', 'Branch Code', 'Branch Name'], ['College Code', 'Branch Code'], high_low_mean=high_low_mean, by_filled=by_filled, cube=cube)
 
     val = val.rename(columns={'Total_Available' : 'Total Available'})
 
@@ -370,23 +1081,20 @@ class SeatMatrix:
 
     if by_filled:
       if cum:
-        val.to_excel(path + '/College-wise Branch-wise Round-wise Filling - By Filled - Cumulative.xlsx', index=False)
+        _to_excel(val, path + '/College-wise Branch-wise Round-wise Filling - By Filled - Cumulative.xlsx')
       else:
-        val.to_excel(path + '/College-wise Branch-wise Round-wise Filling - By Filled - Non-Cumulative.xlsx', index=False)
+        _to_excel(val, path + '/College-wise Branch-wise Round-wise Filling - By Filled - Non-Cumulative.xlsx')
     else:
       if cum:
-        val.to_excel(path + '/College-wise Branch-wise Round-wise Filling - By Total - Cumulative.xlsx', index=False)
+        _to_excel(val, path + '/College-wise Branch-wise Round-wise Filling - By Total - Cumulative.xlsx')
       else:
-        val.to_excel(path + '/College-wise Branch-wise Round-wise Filling - By Total - Non-Cumulative.xlsx', index=False)
+        _to_excel(val, path + '/College-wise Branch-wise Round-wise Filling - By Total - Non-Cumulative.xlsx')
 
     return val
 
-  def evaluate_rounds_roundwise_collegewise_branchwise_communitywise(self, rounds, rank_list, community, by_filled=True, high_low_mean=False, cum=None, path=''):
+  def evaluate_rounds_roundwise_collegewise_branchwise_communitywise(self, rounds, rank_list, community, by_filled=True, high_low_mean=False, cum=None, path='', cube=None):
     round_names = [round.name for round in rounds]
 
-    communities = ['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']
-    comm_dropped = [com for com in communities if com != community]
-
     if high_low_mean == True:
       temp = [[f'{names}', f'{names} Filled %', f'{names} Lowest Cutoff', f'{names} Highest Cutoff', f'{names} Average Cutoff'] for names in round_names]
     else:
@@ -396,32 +1104,14 @@ class SeatMatrix:
     round_std = ['College Code', 'College Name', 'Branch Code', 'Branch Name'] + round_std + ['Total Available' ,'Total Filled', 'Total % Filled']
 
 
-    if high_low_mean == True:
-      val = self.data.drop(columns=comm_dropped).groupby(['College Code', 'College Name', 'Branch Code', 'Branch Name']).apply(
-          lambda group : (group.assign(
-                  **{x.name : (len(x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=community))) for x in rounds},
-                  Total_Available = self.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=community).tolist()[-1],
-                  **{f'{x.name} Filled %' : 0 if (temp := (len(rank_list.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=community)) if by_filled else self.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=community).tolist()[-1])) == 0 else ((len(x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=community)) / temp)*100) for x in rounds},
-                  TEMP1 = 0,
-                  **{f'{x.name} Lowest Cutoff' : 0 if len(temp := x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=community)) == 0 else temp['Cutoff Mark'].min() for x in rounds},
-                  TEMP2 = 0,
-                  **{f'{x.name} Highest Cutoff' : 0 if len(temp := x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=community)) == 0 else temp['Cutoff Mark'].max() for x in rounds},
-                  TEMP3 = 0,
-                  **{f'{x.name} Average Cutoff' : 0 if len(temp := x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=community)) == 0 else temp['Cutoff Mark'].mean() for x in rounds}
-          ))
-      ).drop(columns=['College Code', 'College Name', 'Branch Code', 'Branch Name', 'TEMP1', 'TEMP2', 'TEMP3', community]).reset_index(level=[4], drop=True).reset_index().drop_duplicates().reset_index(drop=True)
-
-    else:
-      val = self.data.drop(columns=comm_dropped).groupby(['College Code', 'College Name', 'Branch Code', 'Branch Name']).apply(
-          lambda group : (group.assign(
-                  **{x.name : (len(x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=community))) for x in rounds},
-                  Total_Available = self.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=community).tolist()[-1],
-                  **{f'{x.name} Filled %' : 0 if (temp := (len(rank_list.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=community)) if by_filled else self.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=community).tolist()[-1])) == 0 else ((len(x.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=community)) / temp)*100) for x in rounds}
-          ))
-      ).drop(columns=['College Code', 'College Name', 'Branch Code', 'Branch Name', community]).reset_index(level=[4], drop=True).reset_index().drop_duplicates().reset_index(drop=True)
-
+    val = self._roundwise_table(rounds, rank_list, ['College Code', 'College Name', 'Branch Code', 'Branch Name'], ['College Code', 'Branch Code'], high_low_mean=high_low_mean, by_filled=by_filled, community=community, cube=cube)
 
+    return self._write_communitywise(val, round_names, round_std, community, by_filled, cum, path)
 
+  def _write_communitywise(self, val, round_names, round_std, community, by_filled, cum, path):
+    """
+      Adds the totals to a college-wise branch-wise table of one community, cumulates it and writes it (see evaluate_rounds_roundwise_collegewise_branchwise_communitywise).
+    """
     val = val.rename(columns={'Total_Available' : 'Total Available'})
 
     val['Total Filled'] = val[round_names].sum(axis=1)
@@ -429,11 +1119,11 @@ class SeatMatrix:
 
     val = val[round_std]
 
-    if len(rounds) > 1 and cum != None:
+    if len(round_names) > 1 and cum != None:
       round_filled_names = [f'{round} Filled %' for round in round_names]
       for ind, round_filled_name in enumerate(round_filled_names[1:]):
         val[round_filled_names[ind + 1]] = val[round_filled_names[ind + 1]] + val[round_filled_names[ind]]
-    elif cum == True and len(rounds) == 1:
+    elif cum == True and len(round_names) == 1:
       print('Cannot Cumulate for One Round...')
       return val
 
@@ -448,49 +1138,92 @@ class SeatMatrix:
 
     if by_filled:
       if cum:
-        val.to_excel(path + '/College-wise Branch-wise Community-wise Round-wise Filling - By Filled - Cumulative.xlsx', index=False)
+        _to_excel(val, path + '/College-wise Branch-wise Community-wise Round-wise Filling - By Filled - Cumulative.xlsx')
       else:
-        val.to_excel(path + '/College-wise Branch-wise Community-wise Round-wise Filling - By Filled - Non-Cumulative.xlsx', index=False)
+        _to_excel(val, path + '/College-wise Branch-wise Community-wise Round-wise Filling - By Filled - Non-Cumulative.xlsx')
     else:
       if cum:
-        val.to_excel(path + '/College-wise Branch-wise Community-wise Round-wise Filling - By Total - Cumulative.xlsx', index=False)
+        _to_excel(val, path + '/College-wise Branch-wise Community-wise Round-wise Filling - By Total - Cumulative.xlsx')
       else:
-        val.to_excel(path + '/College-wise Branch-wise Community-wise Round-wise Filling - By Total - Non-Cumulative.xlsx', index=False)
+        _to_excel(val, path + '/College-wise Branch-wise Community-wise Round-wise Filling - By Total - Non-Cumulative.xlsx')
 
     return val
 
 
-  def evaluate_rounds_communitywise(self, rank_list, path=''):
-    val = self.data.drop(columns=['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST', 'Branch Code', 'Branch Name']).groupby(['College Code', 'College Name']).apply(
-    lambda group : (group.assign(
-        OC = (oc := len(rank_list.filter(college_code=group['College Code'].iloc[0], community='OC'))),
-        BC = (bc := len(rank_list.filter(college_code=group['College Code'].iloc[0], community='BC'))),
-        BCM = (bcm := len(rank_list.filter(college_code=group['College Code'].iloc[0], community='BCM'))),
-        MBC = (mbc := len(rank_list.filter(college_code=group['College Code'].iloc[0], community='MBC'))),
-        SC = (sc := len(rank_list.filter(college_code=group['College Code'].iloc[0], community='SC'))),
-        SCA = (sca := len(rank_list.filter(college_code=group['College Code'].iloc[0], community='SCA'))),
-        ST = (st := len(rank_list.filter(college_code=group['College Code'].iloc[0], community='ST'))),
-        Total_Filled = (filled := oc + bc + bcm + mbc + sc + sca + st),
-        Total_Available = self.filter(college_code=group['College Code'].iloc[0])[['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']].sum().sum(),
-        OC_Percent = 0 if filled == 0 else (oc/filled) * 100,
-        BC_Percent = 0 if filled == 0 else (bc/filled) * 100,
-        BCM_Percent = 0 if filled == 0 else (bcm/filled) * 100,
-        MBC_Percent = 0 if filled == 0 else (mbc/filled) * 100,
-        SC_Percent = 0 if filled == 0 else (sc/filled) * 100,
-        SCA_Percent = 0 if filled == 0 else (sca/filled) * 100,
-        ST_Percent = 0 if filled == 0 else (st/filled) * 100
-    ))
-    ).reset_index(level=[2], drop=True).drop(columns=['College Code', 'College Name']).reset_index().drop_duplicates().reset_index(drop=True).rename(columns={
-        'Total_Filled' : 'Total Filled',
-        'Total_Available' : 'Total Available',
-        'OC_Percent' : 'OC Filled %',
-        'BC_Percent' : 'BC Filled %',
-        'BCM_Percent' : 'BCM Filled %',
-        'MBC_Percent' : 'MBC Filled %',
-        'SC_Percent' : 'SC Filled %',
-        'SCA_Percent' : 'SCA Filled %',
-        'ST_Percent' : 'ST Filled %'
-    })
+  def evaluate_rounds_roundwise_collegewise_branchwise_allcommunities(self, rounds, rank_list, communities=None, high_low_mean=True, path='', cube=None):
+    """
+      Evaluates evaluate_rounds_roundwise_collegewise_branchwise_communitywise for every community
+      and every cum / by_filled variant from a single AggregateCube of the rounds.
+
+      The round and RankList statistics of every community are read from the cube in one pass grouped by
+      (College Code, Branch Code, Allotted Community), and the seats of every community in one lookup, so each
+      of the tables is only assembled from those arrays and written.
+
+      Return:
+        dict   =>   {(community, by_filled, cum) : pd.DataFrame}
+    """
+    if communities == None:
+      communities = ['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']
+
+    if cube is None:
+      cube = AggregateCube(rounds, rank_list)
+
+    group_keys = ['College Code', 'College Name', 'Branch Code', 'Branch Name']
+    keys = ['College Code', 'Branch Code']
+
+    round_names = [round.name for round in rounds]
+    if high_low_mean == True:
+      temp = [[f'{names}', f'{names} Filled %', f'{names} Lowest Cutoff', f'{names} Highest Cutoff', f'{names} Average Cutoff'] for names in round_names]
+    else:
+      temp = [[f'{names}', f'{names} Filled %'] for names in round_names]
+    round_std = group_keys + [j for i in temp for j in i] + ['Total Available' ,'Total Filled', 'Total % Filled']
+
+    val = _group_frame(self.data, group_keys)
+    index = _key_index(val, keys)
+
+    available = self.data.drop_duplicates(subset=keys, keep='last').set_index(keys)[communities].reindex(index)
+
+    stats = cube.round_statistics(keys + ['Allotted Community'])
+    stats = {community : group.droplevel('Allotted Community') for community, group in stats.groupby(level='Allotted Community', observed=True, sort=False)}
+    empty = cube.round_statistics(keys + ['Allotted Community']).iloc[:0].droplevel('Allotted Community')
+
+    filled = cube.rank_list_statistics(keys + ['Allotted Community'])['count'].unstack('Allotted Community', fill_value=0)
+    filled = filled.reindex(index=index, columns=communities, fill_value=0).fillna(0).astype(np.int64)
+
+    result = {}
+    for community in communities:
+      counts, cutoffs = self._round_lookups(rounds, stats.get(community, empty), index, high_low_mean)
+      seats = available[community].to_numpy()
+
+      for by_filled in [False, True]:
+        denominator = filled[community].to_numpy() if by_filled else seats
+        table = pd.concat([val, pd.DataFrame(self._roundwise_columns(rounds, counts, cutoffs, seats, denominator))], axis=1)
+
+        for cum in [False, True]:
+          result[(community, by_filled, cum)] = self._write_communitywise(table, round_names, round_std, community, by_filled, cum, path)
+
+    return result
+
+  def evaluate_rounds_communitywise(self, rank_list, path='', cube=None):
+    communities = ['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']
+
+    if cube is None:
+      cube = AggregateCube([], rank_list)
+
+    val = _group_frame(self.data, ['College Code', 'College Name'])
+    index = _key_index(val, ['College Code'])
+
+    filled = cube.rank_list_statistics(['College Code', 'Allotted Community'])['count'].unstack('Allotted Community', fill_value=0)
+    filled = filled.reindex(index=index, columns=communities, fill_value=0).fillna(0).astype(np.int64)
+
+    for community in communities:
+      val[community] = filled[community].to_numpy()
+
+    val['Total Filled'] = val[communities].sum(axis=1)
+    val['Total Available'] = self.data.groupby('College Code', observed=True)[communities].sum().sum(axis=1).reindex(index).to_numpy()
+
+    for community in communities:
+      val[f'{community} Filled %'] = np.where(val['Total Filled'] == 0, 0, (val[community] / val['Total Filled'].where(val['Total Filled'] != 0)) * 100)
 
     communities = ['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']
     temp = [[f'{community}', f'{community} Filled %'] for community in communities]
@@ -502,7 +1235,7 @@ class SeatMatrix:
 
     os.makedirs(f'./{path}/Community-wise Analysis', exist_ok=True)
 
-    val.to_excel(f'./{path}/Community-wise Analysis/College-wise Community Distribution.xlsx', index=False)
+    _to_excel(val, f'./{path}/Community-wise Analysis/College-wise Community Distribution.xlsx')
 
     return val
 
@@ -511,87 +1244,74 @@ class SeatMatrix:
       print('No Filter Applied to SeatMatrix Data...')
       return self.data.copy()
 
-    filtered = self.data.copy()
+    filtered = _indexed_filter(self, INDEX_KEYS, college_code=college_code, branch_code=branch_code)
 
-    if college_code:
-      filtered = filtered[filtered['College Code'] == college_code]
-    if branch_code:
-      filtered = filtered[filtered['Branch Code'] == branch_code]
     if community in ['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']:
       filtered = filtered[community]
 
     return filtered
 
   def run_all_pipeline(self, rounds, rank_list, communities, path):
+    cube = AggregateCube(rounds, rank_list)
+
     self.evaluate_rounds_sm(rounds, path=path)
 
 
-    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=False, path=path)
-    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=True, path=path)
-    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=False, path=path)
-    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=True, path=path)
+    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=False, path=path, cube=cube)
+    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=True, path=path, cube=cube)
+    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=False, path=path, cube=cube)
+    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=True, path=path, cube=cube)
 
 
-    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=False, path=path)
-    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=True, path=path)
-    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=False, path=path)
-    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=True, path=path)
+    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=False, path=path, cube=cube)
+    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=True, path=path, cube=cube)
+    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=False, path=path, cube=cube)
+    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=True, path=path, cube=cube)
 
-    for community in communities:
-      self.evaluate_rounds_roundwise_collegewise_branchwise_communitywise(rounds, rank_list, community=community, high_low_mean=True, cum=False, by_filled=False, path=path)
-      self.evaluate_rounds_roundwise_collegewise_branchwise_communitywise(rounds, rank_list, community=community, high_low_mean=True, cum=False, by_filled=True, path=path)
-      self.evaluate_rounds_roundwise_collegewise_branchwise_communitywise(rounds, rank_list, community=community, high_low_mean=True, cum=True, by_filled=False, path=path)
-      self.evaluate_rounds_roundwise_collegewise_branchwise_communitywise(rounds, rank_list, community=community, high_low_mean=True, cum=True, by_filled=True, path=path)
+    self.evaluate_rounds_roundwise_collegewise_branchwise_allcommunities(rounds, rank_list, communities=communities, high_low_mean=True, path=path, cube=cube)
 
-    self.evaluate_rounds_communitywise(rank_list, path=path)
+    self.evaluate_rounds_communitywise(rank_list, path=path, cube=cube)
 
-  def run_sm_pipeline(self, rounds, path=''):
-    self.evaluate_rounds_sm(rounds, path=path)
+  def run_sm_pipeline(self, rounds, path='', ledger=None):
+    return self.evaluate_rounds_sm(rounds, path=path, ledger=ledger)
 
-  def run_collegewise_pipeline(self, rounds, rank_list, path=''):
-    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=False, path=path)
-    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=True, path=path)
-    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=False, path=path)
-    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=True, path=path)
-
-  def run_collegewise_branchwise_pipeline(self, rounds, rank_list, path=''):
-    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=False, path=path)
-    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=True, path=path)
-    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=False, path=path)
-    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=True, path=path)
+  def run_collegewise_pipeline(self, rounds, rank_list, path='', cube=None):
+    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=False, path=path, cube=cube)
+    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=True, path=path, cube=cube)
+    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=False, path=path, cube=cube)
+    self.evaluate_rounds_roundwise_collegewise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=True, path=path, cube=cube)
+
+  def run_collegewise_branchwise_pipeline(self, rounds, rank_list, path='', cube=None):
+    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=False, path=path, cube=cube)
+    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=False, by_filled=True, path=path, cube=cube)
+    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=False, path=path, cube=cube)
+    self.evaluate_rounds_roundwise_collegewise_branchwise(rounds, rank_list, high_low_mean=True, cum=True, by_filled=True, path=path, cube=cube)
   
-  def run_collegewise_branchwise_communitywise_pipeline(self, rounds, rank_list, path=''):
-    
-    communities = list(rank_list['Allotted Community'].unique)
-    print(type(communities))
+  def run_collegewise_branchwise_communitywise_pipeline(self, rounds, rank_list, path='', cube=None):
+    communities = [community for community in ['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST'] if community in set(rank_list.data['Allotted Community'])]
 
-    for community in communities:
-      self.evaluate_rounds_roundwise_collegewise_branchwise_communitywise(rounds, rank_list, community=community, high_low_mean=True, cum=False, by_filled=False, path=path)
-      self.evaluate_rounds_roundwise_collegewise_branchwise_communitywise(rounds, rank_list, community=community, high_low_mean=True, cum=False, by_filled=True, path=path)
-      self.evaluate_rounds_roundwise_collegewise_branchwise_communitywise(rounds, rank_list, community=community, high_low_mean=True, cum=True, by_filled=False, path=path)
-      self.evaluate_rounds_roundwise_collegewise_branchwise_communitywise(rounds, rank_list, community=community, high_low_mean=True, cum=True, by_filled=True, path=path)
+    self.evaluate_rounds_roundwise_collegewise_branchwise_allcommunities(rounds, rank_list, communities=communities, high_low_mean=True, path=path, cube=cube)
 
-  def run_communitywise_pipeline(self, rank_list, path=''):
-    self.evaluate_rounds_communitywise(rank_list, path=path)
+  def run_communitywise_pipeline(self, rank_list, path='', cube=None):
+    self.evaluate_rounds_communitywise(rank_list, path=path, cube=cube)
 
-  def form1(self, rounds, rank_list):
+  def form1(self, rounds, rank_list, cube=None):
     by_filled = True
     cum = True
 
+    if cube is None:
+      cube = AggregateCube(rounds, rank_list)
+
     round_names = [round.name for round in rounds]
-    val = self.data.drop(columns=['Branch Name', 'Branch Code', 'OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']).groupby(['College Code', 'College Name']).apply(
-              lambda group : (group.assign(
-                      **{x.name : (len(x.filter(college_code=group['College Code'].iloc[0]))) for x in rounds},
-                      Total_Available = self.filter(college_code=group['College Code'].iloc[0])[['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']].sum().sum(),
-                      **{f'{x.name} Filled %' : 0 if (temp := (len(rank_list.filter(college_code=group['College Code'].iloc[0])) if by_filled else self.filter(college_code=group['College Code'].iloc[0])[['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']].sum().sum())) == 0 else ((len(x.filter(college_code=group['College Code'].iloc[0])) / temp)*100) for x in rounds},
-                      TEMP=0,
-                      **{f'Opening Rank for {x.name}' : x.filter(college_code=group['College Code'].iloc[0])['Rank'].min() for x in rounds},
-                      TEMP1=0,
-                      **{f'Closing Rank for {x.name}' : x.filter(college_code=group['College Code'].iloc[0])['Rank'].max() for x in rounds},
-                      TEMP2=0,
-                      Average_Cutoff = rank_list.filter(college_code=group['College Code'].iloc[0])['Cutoff Mark'].mean()
-              ))
-          ).drop(columns=['College Code', 'College Name']).reset_index(level=[2], drop=True).reset_index().drop_duplicates().reset_index(drop=True)
+    val = self._roundwise_table(rounds, rank_list, ['College Code', 'College Name'], ['College Code'], by_filled=by_filled, cube=cube)
+    index = _key_index(val, ['College Code'])
+
+    stats = cube.round_statistics(['College Code'])
+    for name in round_names:
+      val[f'Opening Rank for {name}'] = _lookup(stats, ('rank_min', name), index)
+      val[f'Closing Rank for {name}'] = _lookup(stats, ('rank_max', name), index)
+
+    val['Average_Cutoff'] = _lookup(cube.rank_list_statistics(['College Code']), 'mean', index)
 
     val['Total Filled'] = val[round_names].sum(axis=1)
     val['Remaining Seats'] = val['Total_Available'] - val['Total Filled']
@@ -633,27 +1353,30 @@ class SeatMatrix:
 
     os.makedirs(f'./{st.session_state.year}', exist_ok=True)
     os.makedirs(f'./{st.session_state.year}/Forms', exist_ok=True)
-    val.to_excel(f'./{st.session_state.year}/Forms/Form 1.xlsx', index=False)
+    _to_excel(val, f'./{st.session_state.year}/Forms/Form 1.xlsx')
   
-  def form2(self, rounds, rank_list):
+  def form2(self, rounds, rank_list, cube=None):
     import numpy as np
     round_names = [round.name for round in rounds]
     cum = True
 
-    val = self.data.groupby(['College Code', 'College Name', 'Branch Code', 'Branch Name']).apply(
-        lambda group : group.assign(
-            Total_Available=self.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])[['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']].sum(axis=1),
-            **{round.name : len(round.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])) for round in rounds},
-            TEMP=0,
-            Highest_Cutoff = rank_list.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])['Cutoff Mark'].max(),
-            Lowest_Cutoff = rank_list.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])['Cutoff Mark'].min(),
-            Average_Cutoff = rank_list.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])['Cutoff Mark'].mean(),    
-        )
-    )
+    if cube is None:
+      cube = AggregateCube(rounds, rank_list)
 
-    val = val.drop(columns=['College Code', 'College Name', 'Branch Code', 'Branch Name']).reset_index(level=[4], drop=True).reset_index().rename(
-        columns={col : col.replace('_', ' ') for col in val.columns if '_' in col}
-    )
+    keys = ['College Code', 'College Name', 'Branch Code', 'Branch Name']
+    val = _decode_categories(self.data.dropna(subset=keys)).sort_values(by=keys, kind='stable', ignore_index=True)
+    index = _key_index(val, ['College Code', 'Branch Code'])
+
+    val['Total Available'] = val[['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']].sum(axis=1)
+
+    stats = cube.round_statistics(['College Code', 'Branch Code'])
+    for name in round_names:
+      val[name] = np.nan_to_num(_lookup(stats, ('count', name), index)).astype(np.int64)
+
+    stats = cube.rank_list_statistics(['College Code', 'Branch Code'])
+    val['Highest Cutoff'] = _lookup(stats, 'max', index)
+    val['Lowest Cutoff'] = _lookup(stats, 'min', index)
+    val['Average Cutoff'] = _lookup(stats, 'mean', index)
 
     for name in round_names:
       val[f'{name} Filled %'] = (val[name] / val['Total Available']) * 100
@@ -679,25 +1402,27 @@ class SeatMatrix:
 
     val = val[std_cols]
     
-    val.to_excel(f'./{st.session_state.year}/Forms/Form 2.xlsx', index=False)
+    _to_excel(val, f'./{st.session_state.year}/Forms/Form 2.xlsx')
 
-  def form3(self, rounds, rank_list):
-    import numpy as np
-    val = self.data.melt(id_vars=['College Code', 'College Name', 'Branch Code', 'Branch Name'],
+  def form3(self, rounds, rank_list, cube=None):
+    if cube is None:
+      cube = AggregateCube(rounds, rank_list)
+
+    keys = ['College Code', 'College Name', 'Branch Code', 'Branch Name']
+    val = _decode_categories(self.data).melt(id_vars=keys,
             value_vars=['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST'],
             var_name='Community',
             value_name='Seats Available').drop(columns=['Seats Available'])
 
-    val = val.groupby(['College Code', 'College Name', 'Branch Code', 'Branch Name', 'Community']).apply(lambda group : group.assign(
-        Opening_Rank = rank_list.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=group['Community'].iloc[0])['Rank'].min(),
-        Closing_Rank = rank_list.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=group['Community'].iloc[0])['Rank'].max(),
-        Opening_Cutoff = rank_list.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=group['Community'].iloc[0])['Cutoff Mark'].max(),
-        Closing_Cutoff = rank_list.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0], community=group['Community'].iloc[0])['Cutoff Mark'].min()
-    )).drop(
-            columns=['College Code', 'College Name', 'Branch Code', 'Branch Name']
-          ).reset_index(level=[4], drop=True).reset_index()
+    val = val.dropna(subset=keys).sort_values(by=keys + ['Community'], kind='stable', ignore_index=True)
+    index = _key_index(val.rename(columns={'Community' : 'Allotted Community'}), ['College Code', 'Branch Code', 'Allotted Community'])
+
+    stats = cube.rank_list_statistics(['College Code', 'Branch Code', 'Allotted Community'])
+    val['Opening Rank'] = _lookup(stats, 'rank_min', index)
+    val['Closing Rank'] = _lookup(stats, 'rank_max', index)
+    val['Opening Cutoff'] = _lookup(stats, 'max', index)
+    val['Closing Cutoff'] = _lookup(stats, 'min', index)
 
-    val = val.rename(columns={col : col.replace('_', " ") for col in val.columns})
     val = val[['College Code', 'College Name', 'Branch Code', 'Branch Name', 'Community', 'Opening Rank', 'Opening Cutoff', 'Closing Rank', 'Closing Cutoff']]
 
     for col in val.columns:
@@ -705,14 +1430,165 @@ class SeatMatrix:
         val[col] = val[col].astype(str)
         val[col] = val[col].str.replace('.0', '')
 
-    val = val.sort_values(by='Community').groupby(['College Code', 'College Name', 'Branch Code', 'Branch Name']).apply(
-        lambda x : x.assign(TEMP=0)
-    ).reset_index(level=[4], drop=True).drop(columns=['College Code', 'College Name', 'Branch Code', 'Branch Name', 'TEMP']).reset_index()
+    _to_excel(val, f'./{st.session_state.year}/Forms/Form 3.xlsx')
+
+def _build(cls, args, kwargs, pooled=False):
+  start = time.perf_counter()
+  obj = cls(*args, **kwargs)
+
+  if pooled:
+    # Cheaper to rebuild in the parent than to pickle back, and stale once the data is re-encoded there
+    obj._index = None
+
+  return obj, time.perf_counter() - start
+
+
+def _load_in_parallel(jobs):
+  """
+    Constructs the objects of jobs, a dict of name -> (cls, args, kwargs), concurrently in a process pool.
+
+    Each Round and SeatMatrix is an independent Excel parse, so the wall-clock time approaches that of the
+    slowest file. The workers are spawned rather than forked, as forking the multithreaded Streamlit server can
+    deadlock on locks held by its other threads. The objects come back encoded against the workers' code tables
+    and without their FrameIndex; they are re-encoded against this process's shared tables and indexed here.
+    Falls back to constructing them one by one if the pool cannot be started or breaks.
+
+    Objects whose cleaned data is already cached (see Cache.py) load in a fraction of the time it takes to start
+    a worker, so they are constructed here, and the pool is only used when at least two Excel files are left to parse.
+
+    Return:
+      dict   =>   name -> constructed object, in the order of jobs.
+  """
+  if len(jobs) == 0:
+    return {}
+
+  built = {}
+  for name, (cls, args, kwargs) in jobs.items():
+    cache = Cache.source_cache_path(cls.__name__, args[0], kwargs.get('rename_dict'))
+    if cache != None and os.path.exists(cache):
+      built[name] = _build(cls, args, kwargs)
+
+  misses = {name : job for name, job in jobs.items() if name not in built}
+  workers = min(len(misses), os.cpu_count() or 1)
+
+  if workers > 1:
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+      try:
+        # Only failures to start the workers fall back; errors raised by a job itself (e.g. a missing file) propagate
+        futures = {name : pool.submit(_build, *job, pooled=True) for name, job in misses.items()}
+      except (BrokenProcessPool, OSError) as e:
+        print(f'Could not start loading in parallel ({e}), loading sequentially...')
+      else:
+        try:
+          for name, future in futures.items():
+            built[name] = future.result()
+        except BrokenProcessPool as e:
+          print(f'Could not load in parallel ({e}), loading sequentially...')
+
+  for name, job in misses.items():
+    if name not in built:
+      built[name] = _build(*job)
+
+  loaded = {}
+  for name in jobs:
+    obj, seconds = built[name]
+    _encode_categories(obj.data)
+    if obj._index is None:
+      obj._index = FrameIndex(obj.data, INDEX_KEYS)
+    Instrumentation.record(f'Loading {name}', seconds)
+    loaded[name] = obj
+
+  return loaded
+
+
+def _load_session_inputs(rename_dict, sm_rename_dict):
+  """
+    Loads, together (see _load_in_parallel), the rounds published since the session's rounds were simulated and the
+    SeatMatrix if the session does not hold one yet.
+
+    Return:
+      dict   =>   Round name -> Round for every newly loaded round, and 'SeatMatrix' -> SeatMatrix if it was loaded.
+  """
+  jobs = {}
+
+  for i in range(len(st.session_state.get('round_objs') or []), st.session_state.rounds):
+    jobs[f'Round {i+1}'] = (Round, (f'Inputs/RankList {i+1}.xlsx', f'Round {i+1}'), {'rename_dict' : rename_dict})
+
+  if not st.session_state.get('seat_matrix'):
+    jobs['SeatMatrix'] = (SeatMatrix, ('Inputs/SeatMatrix.xlsx',), {'rename_dict' : sm_rename_dict})
+
+  return _load_in_parallel(jobs)
+
+
+def _publish_new_rounds(rounds):
+  """
+    Adds the rounds published since the cached rounds were simulated to the cached RankList and
+    AggregateCube, so a refresh only processes the new rounds.
+  """
+  for round in rounds:
+    if st.session_state.get('rank_list'):
+      if st.session_state.get('cube'):
+        st.session_state.cube.add_round(round, st.session_state.rank_list)
+      st.session_state.rank_list.add_round(round)
+
+    st.session_state.round_objs.append(round)
+
+
+def _cached_cube():
+  """
+    The session's AggregateCube, rebuilt only when it does not cover the session's rounds.
+  """
+  round_names = [round.name for round in st.session_state.round_objs]
+
+  if not st.session_state.get('cube') or st.session_state.cube.round_names != round_names:
+    st.session_state.cube = AggregateCube(st.session_state.round_objs, st.session_state.rank_list)
+
+  return st.session_state.cube
+
+
+def _simulate_session(run, rename_dict, sm_rename_dict):
+  """
+    Simulates the session's Rounds, SeatMatrix and RankList, loading or updating only what the session does
+    not hold yet. Every step is timed as a stage of run and reported in a status widget.
+
+    Return:
+      AggregateCube   =>   The session's AggregateCube, covering all of its rounds.
+  """
+  with st.status('Simulating Rounds, SeatMatrix and RankList as Objects') as status:
+    run.status = status
+
+    with run.stage('Loading Rounds and SeatMatrix'):
+      loaded = _load_session_inputs(rename_dict, sm_rename_dict)
+
+    if not st.session_state.get('round_objs'):
+      st.session_state.round_objs = [loaded[f'Round {i+1}'] for i in range(st.session_state.rounds)]
+    elif len(st.session_state.round_objs) < st.session_state.rounds:
+      with run.stage('Simulating New Rounds'):
+        _publish_new_rounds([loaded[f'Round {i+1}'] for i in range(len(st.session_state.round_objs), st.session_state.rounds)])
+    else:
+      status.write('Using Cached Rounds')
+
+    if not st.session_state.get('seat_matrix'):
+      st.session_state.seat_matrix = loaded['SeatMatrix']
+    else:
+      status.write('Using Cached SeatMatrix')
+
+    if not st.session_state.get('rank_list'):
+      with run.stage('Simulating RankList'):
+        st.session_state.rank_list = RankList(rounds=st.session_state.round_objs)
+    else:
+      status.write('Using Cached RankList')
+
+    with run.stage('Building AggregateCube'):
+      cube = _cached_cube()
+
+    status.update(label='Simulation Complete', state='complete', expanded=False)
+    run.status = None
+
+  return cube
 
-    val.to_excel(f'./{st.session_state.year}/Forms/Form 3.xlsx', index=False)
 
 def Process(options):
-  import time
 
   rename_dict = {
       'COMMUNI\rTY' : 'Community',
@@ -733,77 +1609,34 @@ def Process(options):
     'BRANCH NAME' : 'Branch Name'
   }
 
-  with st.spinner('Evaluating Selected Options'):
-    time.sleep(3)
+  with Instrumentation.Run('Process') as run:
+    cube = _simulate_session(run, rename_dict, sm_rename_dict)
 
-  with st.status('Simulating Rounds, SeatMatrix and RankList as Objects') as status:
-    time.sleep(3)
+    path = f'{st.session_state.year}'
 
-    if not st.session_state.get('round_objs'):
-      status.update(label='Simulating Rounds', state='running')
-      rounds = []
-      for i in range(st.session_state.rounds):
-        rounds.append(Round(f'Inputs/RankList {i+1}.xlsx', f'Round {i+1}', rename_dict=rename_dict))
-      st.session_state.round_objs = rounds
-      status.update(label='Simulating Rounds Completed...', state='complete')
-      time.sleep(2)
-    else:
-      status.update(label='Loading Cached Rounds', state='running')
-      time.sleep(3)
-      status.update(label='Loaded Cached Rounds Successfully', state='complete')
-      time.sleep(2)
+    with st.spinner('Processing Selected Options'):
+      for option in options:
+        if option == 'SeatMatrix Round-wise':
+          with st.spinner('Processing SeatMatrix Pipeline'), run.stage('SeatMatrix Pipeline'):
+            st.session_state.ledger = st.session_state.seat_matrix.run_sm_pipeline(rounds=st.session_state.round_objs, path=path, ledger=st.session_state.get('ledger'))
 
+        if option == 'College-wise Round-wise':
+          with st.spinner('Processing College-wise Pipeline'), run.stage('College-wise Pipeline'):
+            st.session_state.seat_matrix.run_collegewise_pipeline(rounds=st.session_state.round_objs, rank_list=st.session_state.rank_list, path=path, cube=cube)
 
-    if not st.session_state.get('seat_matrix'):
-      status.update(label='Simulating SeatMatrix', state='running')
-      seat_matrix = SeatMatrix('Inputs/SeatMatrix.xlsx', rename_dict=sm_rename_dict)
-      st.session_state.seat_matrix = seat_matrix
-      status.update(label='Simulating SeatMatrix Completed...', state='complete')
-      time.sleep(2)
-    else:
-      status.update(label='Loading Cached SeatMatrix', state='running')
-      time.sleep(3)
-      status.update(label='Loaded Cached SeatMatrix Successfully', state='complete')
-      time.sleep(2)
+        if option == 'College-wise Branch-wise Round-wise':
+          with st.spinner('Processing College-wise Branch-wise Pipeline'), run.stage('College-wise Branch-wise Pipeline'):
+            st.session_state.seat_matrix.run_collegewise_branchwise_pipeline(rounds=st.session_state.round_objs, rank_list=st.session_state.rank_list, path=path, cube=cube)
 
-    if not st.session_state.get('rank_list'):
-      status.update(label='Simulating RankList', state='running')
-      rank_list = RankList(rounds=st.session_state.round_objs)
-      st.session_state.rank_list = rank_list
-      status.update(label='Simulating RankList Completed...', state='complete')
-      time.sleep(2)
-    else:
-      status.update(label='Loading Cached RankList', state='running')
-      time.sleep(3)
-      status.update(label='Loaded Cached RankList Successfully', state='complete')
-      time.sleep(2)
+        if option == 'College-wise Branch-wise Community-wise Round-wise':
+          with st.spinner('Processing College-wise Branch-wise Community-wise Pipeline'), run.stage('College-wise Branch-wise Community-wise Pipeline'):
+            st.session_state.seat_matrix.run_collegewise_branchwise_communitywise_pipeline(rounds=st.session_state.round_objs, rank_list=st.session_state.rank_list, path=path, cube=cube)
 
-    status.update(label='Simulation Complete', state='complete', expanded=False)
-
-  path = f'{st.session_state.year}'
-
-  with st.spinner('Processing Selected Options'):
-    for option in options:
-      if option == 'SeatMatrix Round-wise':
-        with st.spinner('Processing SeatMatrix Pipeline'):
-          st.session_state.seat_matrix.run_sm_pipeline(rounds=st.session_state.round_objs, path=path)
-      
-      if option == 'College-wise Round-wise':
-        with st.spinner('Processing College-wise Pipeline'):
-          st.session_state.seat_matrix.run_collegewise_pipeline(rounds=st.session_state.round_objs, rank_list=st.session_state.rank_list, path=path)
-      
-      if option == 'College-wise Branch-wise Round-wise':
-        with st.spinner('Processing College-wise Branch-wise Pipeline'):
-          st.session_state.seat_matrix.run_collegewise_branchwise_pipeline(rounds=st.session_state.round_objs, rank_list=st.session_state.rank_list, path=path)
-
-      if option == 'College-wise Branch-wise Community-wise Round-wise':
-        with st.spinner('Processing College-wise Branch-wise Community-wise Pipeline'):
-          st.session_state.seat_matrix.run_collegewise_branchwise_communitywise_pipeline(rounds=st.session_state.round_objs, rank_list=st.session_state.rank_list, path=path)
-      
-      if option == 'Community-wise Analysis':
-        with st.spinner('Processing Community-wise Analysis Pipeline'):
-          st.session_state.seat_matrix.run_communitywise_pipeline(rank_list=st.session_state.rank_list, path=path)
+        if option == 'Community-wise Analysis':
+          with st.spinner('Processing Community-wise Analysis Pipeline'), run.stage('Community-wise Analysis Pipeline'):
+            st.session_state.seat_matrix.run_communitywise_pipeline(rank_list=st.session_state.rank_list, path=path, cube=cube)
 
+  run.show()
   st.success('Processing Complete for Selected Options...')
 
 def runForms():
@@ -826,57 +1659,62 @@ def runForms():
     'BRANCH' : 'Branch Code',
     'BRANCH NAME' : 'Branch Name'
   }
-  import time
-  with st.status('Simulating Rounds, SeatMatrix and RankList as Objects') as status:
-    time.sleep(3)
 
-    if not st.session_state.get('round_objs'):
-      status.update(label='Simulating Rounds', state='running')
-      rounds = []
-      for i in range(st.session_state.rounds):
-        rounds.append(Round(f'Inputs/RankList {i+1}.xlsx', f'Round {i+1}', rename_dict=rename_dict))
-      st.session_state.round_objs = rounds
-      status.update(label='Simulating Rounds Completed...', state='complete')
-      time.sleep(2)
-    else:
-      status.update(label='Loading Cached Rounds', state='running')
-      time.sleep(3)
-      status.update(label='Loaded Cached Rounds Successfully', state='complete')
-      time.sleep(2)
+  with Instrumentation.Run('Forms') as run:
+    cube = _simulate_session(run, rename_dict, sm_rename_dict)
+
+    with st.spinner('Processing Required Forms'):
+      with st.spinner('Processing Form 1'), run.stage('Form 1'):
+        st.session_state.seat_matrix.form1(st.session_state.round_objs, st.session_state.rank_list, cube=cube)
+      with st.spinner('Processing Form 2'), run.stage('Form 2'):
+        st.session_state.seat_matrix.form2(st.session_state.round_objs, st.session_state.rank_list, cube=cube)
+      with st.spinner('Processing Form 3'), run.stage('Form 3'):
+        st.session_state.seat_matrix.form3(st.session_state.round_objs, st.session_state.rank_list, cube=cube)
+
+  run.show()
+  st.toast('Completed Processing for Required Forms...')
+
+
+@st.cache_resource(show_spinner='Comparing Seat Matrices...', max_entries=4)
+def _comparison(path_a, hash_a, path_b, hash_b):
+  a = SeatMatrix(path_a)
+  b = SeatMatrix(path_b)
+
+  collegewise = a.diff(b, keys=['College Code'])
+  collegebranch = a.diff(b, keys=['College Code', 'Branch Code'])
+
+  return {
+    'fingerprint' : (hash_a, hash_b),
+    'a' : a,
+    'b' : b,
+    'collegewise' : collegewise,
+    'collegebranch' : collegebranch,
+    'collegewise_search' : SearchIndex(collegewise, ['College Name', 'College Code']),
+    'collegebranch_search' : SearchIndex(collegebranch, ['College Name', 'College Code', 'Branch Name', 'Branch Code'], case_sensitive=['Branch Code'])
+  }
 
 
-    if not st.session_state.get('seat_matrix'):
-      status.update(label='Simulating SeatMatrix', state='running')
-      seat_matrix = SeatMatrix('Inputs/SeatMatrix.xlsx', rename_dict=sm_rename_dict)
-      st.session_state.seat_matrix = seat_matrix
-      status.update(label='Simulating SeatMatrix Completed...', state='complete')
-      time.sleep(2)
-    else:
-      status.update(label='Loading Cached SeatMatrix', state='running')
-      time.sleep(3)
-      status.update(label='Loaded Cached SeatMatrix Successfully', state='complete')
-      time.sleep(2)
+def compare_seat_matrices(path_a='Inputs/a.xlsx', path_b='Inputs/b.xlsx'):
+  """
+    The SeatMatrix of both years and their college-wise and branch-wise diffs, shared by every session.
 
-    if not st.session_state.get('rank_list'):
-      status.update(label='Simulating RankList', state='running')
-      rank_list = RankList(rounds=st.session_state.round_objs)
-      st.session_state.rank_list = rank_list
-      status.update(label='Simulating RankList Completed...', state='complete')
-      time.sleep(2)
-    else:
-      status.update(label='Loading Cached RankList', state='running')
-      time.sleep(3)
-      status.update(label='Loaded Cached RankList Successfully', state='complete')
-      time.sleep(2)
+    They are computed once per process for each pair of file contents; the fingerprints come from Cache.file_hash,
+    which re-reads a file only when its mtime or size changes, so replaced inputs are picked up automatically.
+    The cached objects are shared, so callers must copy a DataFrame before modifying it.
 
-    status.update(label='Simulation Complete', state='complete', expanded=False)
+    Parameters:
+      (i) path_a : str   =>   Seat Matrix of year N-1.
+      (ii) path_b : str   =>   Seat Matrix of year N.
 
-  with st.spinner('Processing Required Forms'):
-    with st.spinner('Processing Form 1'):
-      st.session_state.seat_matrix.form1(st.session_state.round_objs, st.session_state.rank_list)
-    with st.spinner('Processing Form 2'):
-      st.session_state.seat_matrix.form2(st.session_state.round_objs, st.session_state.rank_list)
-    with st.spinner('Processing Form 3'):
-      st.session_state.seat_matrix.form3(st.session_state.round_objs, st.session_state.rank_list)
-  
-  st.toast('Completed Processing for Required Forms...')
\ No newline at end of file
+    Return:
+      dict   =>   'fingerprint' -> content hashes of both files, 'a', 'b' -> SeatMatrix, 'collegewise', 'collegebranch' -> pd.DataFrame returned by SeatMatrix.diff,
+                  'collegewise_search', 'collegebranch_search' -> SearchIndex of those frames.
+  """
+  return _comparison(path_a, Cache.file_hash(path_a), path_b, Cache.file_hash(path_b))
+
+
+def clear_comparisons():
+  """
+    Drops every cached comparison, e.g. after an input file has been saved or deleted.
+  """
+  _comparison.clear()
@@ -1,6 +1,9 @@
+import math
+import numpy as np
 import pandas as pd
 import streamlit as st
-from Processors import SeatMatrix
+import Export
+from Processors import compare_seat_matrices
 from background import BackgroundCSSGenerator
 
 # Set up Streamlit page configuration
@@ -22,180 +25,51 @@ if not st.session_state.get('logged_in'):
     st.error('Please log in through the Home page to access this content.')
 else:
   try:
-    communities = ['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']
-
-    def TotalCollegeWise(sm):
-      result = sm.data.groupby(['College Code', 'College Name']).apply(
-          lambda group : group.assign(
-              Total=sm.filter(college_code=group['College Code'].iloc[0])[communities].sum().sum()
-          )
-      ).reset_index(level=[2], drop=True).drop(columns=['College Code', 'College Name']+['Branch Code', 'Branch Name']).reset_index().drop_duplicates(
-          subset=['College Code']
-      ).reset_index(drop=True).drop(columns=communities)
-
-      return result
-
-    def TotalCollegeBranch(sm):
-      result = sm.data.groupby(['College Code', 'College Name', 'Branch Code', 'Branch Name']).apply(
-          lambda group : group.assign(
-              Total=sm.filter(college_code=group['College Code'].iloc[0], branch_code=group['Branch Code'].iloc[0])[communities].sum(axis=1).iloc[0]
-          )
-      ).reset_index(level=[4], drop=True).drop(columns=['College Code', 'College Name']+['Branch Code', 'Branch Name']).reset_index().drop_duplicates(
-          subset=['College Code', 'Branch Code']
-      ).reset_index(drop=True).drop(columns=communities)
-
-      return result
-
-    def form4(a, b):
-      
-      a = TotalCollegeWise(a)
-      b = TotalCollegeWise(b)
-
-      removed = []
-      new = []
-      common_a = []
-      common_b = []
-
-      for ind, row in a.iterrows():
-        if row['College Code'] not in list(b['College Code']):
-          removed_row = row.copy()
-          removed_row['Total'] = 0
-          removed_row['n'] = st.session_state.a.filter(college_code=removed_row['College Code'])[communities].sum().sum()
-          removed_row['Difference'] = removed_row['Total'] - removed_row['n']
-          removed.append(removed_row)
-        else:
-          common_a.append(row.copy())
-
-      for ind, row in b.iterrows():
-        if row['College Code'] not in list(a['College Code']):
-          new_row = row.copy()
-          new_row['Total'] = st.session_state.b.filter(college_code=new_row['College Code'])[communities].sum().sum()
-          new_row['n'] = 0
-          new_row['Difference'] = new_row['Total'] - new_row['n']
-          new.append(new_row)
-        else:
-          common_b.append(row.copy())
-
-      common_a = pd.DataFrame(common_a)
-      common_b = pd.DataFrame(common_b)
-      new = pd.DataFrame(new)
-      removed = pd.DataFrame(removed)
-
-      result = common_b.groupby(['College Code', 'College Name']).apply(
-        lambda group : group.assign(
-            n=common_a[common_a['College Code']==group['College Code'].iloc[0]]['Total'].iloc[0],
-                Difference=group['Total'].iloc[0] - common_a[common_a['College Code']==group['College Code'].iloc[0]]['Total'].iloc[0]
-            )
-        ).reset_index(level=[2], drop=True).drop(columns=['College Code', 'College Name']).reset_index()
-      
-      result = pd.concat([result, removed, new], ignore_index=True).sort_values(by=['College Code']).reset_index(drop=True)
-      
-      result = result.rename(
-            columns={
-                'n' : 'N-1',
-                'Total' : 'N'
-            }
-        )[['College Code', 'College Name', 'N-1', 'N', 'Difference']]
-
-      
-      if st.session_state.get('years'):
-        if st.session_state.years.get('N-1') and st.session_state.years.get('N'):
-          result = result.rename(
-            columns={
-                'N-1' : st.session_state.years['N-1'],
-                'N' : st.session_state.years['N']
-            }
-          )
-
-      return result
-
-
-    def form5(a, b):
-      
-      a = TotalCollegeBranch(a)
-      b = TotalCollegeBranch(b)
-
-      removed = []
-      new = []
-      common_a = []
-      common_b = []
-
-      for college_code in a['College Code'].unique():
-        for ind, row in a[a['College Code'] == college_code].iterrows():
-          if row['Branch Code'] not in list(b[b['College Code'] == college_code]['Branch Code']):
-            removed_row = row.copy()
-            removed_row['Total'] = 0
-            removed_row['n'] = st.session_state.a.filter(college_code=removed_row['College Code'], branch_code=removed_row['Branch Code'])[communities].sum().sum()
-            removed_row['Difference'] = removed_row['Total'] - removed_row['n']
-            removed.append(removed_row)
-          else:
-            common_a.append(row.copy())
-
-      for college_code in b['College Code'].unique():
-        for ind, row in b[b['College Code'] == college_code].iterrows():
-          if row['Branch Code'] not in list(a[a['College Code'] == college_code]['Branch Code']):
-            new_row = row.copy()
-            new_row['Total'] = st.session_state.b.filter(college_code=new_row['College Code'], branch_code=new_row['Branch Code'])[communities].sum().sum()
-            new_row['n'] = 0
-            new_row['Difference'] = new_row['Total'] - new_row['n']
-            new.append(new_row)
-          else:
-            common_b.append(row.copy())
-
-      common_a = pd.DataFrame(common_a)
-      common_b = pd.DataFrame(common_b)
-      new = pd.DataFrame(new)
-      removed = pd.DataFrame(removed)
-
-      result = common_b.groupby(['College Code', 'College Name', 'Branch Code', 'Branch Name']).apply(
-        lambda group : group.assign(
-            n=common_a[(common_a['College Code']==group['College Code'].iloc[0]) & (common_a['Branch Code']==group['Branch Code'].iloc[0])]['Total'].iloc[0],
-            Difference=group['Total'].iloc[0] - common_a[(common_a['College Code']==group['College Code'].iloc[0]) & (common_a['Branch Code']==group['Branch Code'].iloc[0])]['Total'].iloc[0]
-        )
-        ).reset_index(level=[4], drop=True).drop(columns=['College Code', 'College Name', 'Branch Code', 'Branch Name']).reset_index()
-      
-      result = pd.concat([result, new, removed], ignore_index=True).sort_values(by=['College Code', 'Branch Code']).reset_index(drop=True)
-      
-      result = result.rename(
-            columns={
-                'n' : 'N-1',
-                'Total' : 'N'
-            }
-        )[['College Code', 'College Name', 'Branch Code', 'Branch Name', 'N-1', 'N', 'Difference']]
-      
+    page_sizes = [25, 50, 100, 250]
+
+    def year_columns():
       if st.session_state.get('years'):
         if st.session_state.years.get('N-1') and st.session_state.years.get('N'):
-          result = result.rename(
-            columns={
-                'N-1' : st.session_state.years['N-1'],
-                'N' : st.session_state.years['N']
-            }
-          )
-
-      return result
+          return st.session_state.years['N-1'], st.session_state.years['N']
+
+      return 'N-1', 'N'
+
+    def years(result):
+      before, after = year_columns()
+      return result.rename(columns={'N-1' : before, 'N' : after})
+
+    def form4(comparison):
+      result = comparison['collegewise'][['College Code', 'College Name', 'N-1', 'N', 'Difference']]
+      return years(result)
+
+    def form5(comparison):
+      result = comparison['collegebranch'][['College Code', 'College Name', 'Branch Code', 'Branch Name', 'N-1', 'N', 'Difference']]
+      return years(result)
     
-    def color_row(row):
-      row_color = [''] * len(row)
-      if row['Difference'] > 0:
-          row_color = ['background-color: lightgreen'] * len(row)
-      elif row['Difference'] < 0:
-          row_color = ['background-color: red'] * len(row)
-      
-      if row['2023'] == 0:
-          row_color = ['background-color: green'] * len(row)
-      if row['2024'] == 0:
-          row_color = ['background-color: blue'] * len(row)
+    def row_colors(frame):
+      # Later conditions override earlier ones: removed (blue) over added (green) over increase or decrease
+      before, after = year_columns()
+
+      return np.select(
+        [frame[after] == 0, frame[before] == 0, frame['Difference'] > 0, frame['Difference'] < 0],
+        ['background-color: blue', 'background-color: green', 'background-color: lightgreen', 'background-color: red'],
+        default=''
+      )
 
-      return row_color
+    def page_styles(frame, colors, start, stop):
+      page = frame.iloc[start:stop]
+      styles = pd.DataFrame(np.repeat(colors[start:stop, None], page.shape[1], axis=1), index=page.index, columns=page.columns)
+      return page, styles
 
 
 
-    if not st.session_state.get('a') and not st.session_state.get('b'):
-      st.session_state.a = SeatMatrix('Inputs/a.xlsx')
-      st.session_state.b = SeatMatrix('Inputs/b.xlsx')
+    comparison = compare_seat_matrices('Inputs/a.xlsx', 'Inputs/b.xlsx')
 
-      st.session_state.form4 = form4(st.session_state.a, st.session_state.b)
-      st.session_state.form5 = form5(st.session_state.a, st.session_state.b)
+    st.session_state.a = comparison['a']
+    st.session_state.b = comparison['b']
+
+    st.session_state.form4 = form4(comparison)
+    st.session_state.form5 = form5(comparison)
 
 
 
@@ -207,7 +81,8 @@ else:
 
     if st.session_state.get('form'):
       if st.session_state.form == 'Form 4':
-        st.session_state.filtered = st.session_state.form4.copy()
+        search = comparison['collegewise_search']
+        positions = None
         bound = st.container(border=True)
         left, check1, right = bound.columns([0.4, 0.135, 0.3])
 
@@ -227,16 +102,20 @@ else:
 
         if college_name != '':
           if starts_with == True:
-            st.session_state.filtered = st.session_state.filtered[st.session_state.filtered['College Name'].str.lower().str.startswith(college_name.lower())]
+            positions = search.startswith('College Name', college_name, positions)
           else:
-            st.session_state.filtered = st.session_state.filtered[st.session_state.filtered['College Name'].str.lower().str.contains(college_name.lower())]
+            positions = search.contains('College Name', college_name, positions)
 
         if college_code:
-          st.session_state.filtered = st.session_state.filtered[st.session_state.filtered['College Code'].astype(str).str.startswith(str(college_code))]
+          positions = search.startswith('College Code', college_code, positions)
+
+        st.session_state.filtered = st.session_state.form4 if positions is None else st.session_state.form4.iloc[positions]
+        st.session_state.filter_state = ('Form 4', college_name, starts_with, college_code)
 
 
       elif st.session_state.form == 'Form 5':
-        st.session_state.filtered = st.session_state.form5.copy()
+        search = comparison['collegebranch_search']
+        positions = None
 
         bound = st.container(border=True)
         _college_name, sw_toggle, _college_code = bound.container().columns([0.4, 0.135, 0.3])
@@ -267,34 +146,84 @@ else:
 
         if college_name != '':
           if c_starts_with == True:
-            st.session_state.filtered = st.session_state.filtered[st.session_state.filtered['College Name'].str.lower().str.startswith(college_name.lower())]
+            positions = search.startswith('College Name', college_name, positions)
           else:
-            st.session_state.filtered = st.session_state.filtered[st.session_state.filtered['College Name'].str.lower().str.contains(college_name.lower())]
+            positions = search.contains('College Name', college_name, positions)
 
         if college_code:
-          st.session_state.filtered = st.session_state.filtered[st.session_state.filtered['College Code'].astype(str).str.startswith(str(college_code))]
+          positions = search.startswith('College Code', college_code, positions)
 
         if branch_name != '':
           if b_starts_with == True:
-            st.session_state.filtered = st.session_state.filtered[st.session_state.filtered['Branch Name'].str.lower().str.startswith(branch_name.lower())]
+            positions = search.startswith('Branch Name', branch_name, positions)
           else:
-            st.session_state.filtered = st.session_state.filtered[st.session_state.filtered['Branch Name'].str.lower().str.contains(branch_name.lower())]
+            positions = search.contains('Branch Name', branch_name, positions)
 
         if branch_code:
-          st.session_state.filtered = st.session_state.filtered[st.session_state.filtered['Branch Code'].astype(str).str.startswith(str(branch_code))]
+          positions = search.startswith('Branch Code', branch_code, positions)
+
+        st.session_state.filtered = st.session_state.form5 if positions is None else st.session_state.form5.iloc[positions]
+        st.session_state.filter_state = ('Form 5', college_name, c_starts_with, college_code, branch_name, b_starts_with, branch_code)
 
 
     if type(st.session_state.get('filtered')) == pd.DataFrame:
-      #st.dataframe(st.session_state.filtered,use_container_width=True)
-      styled_df = st.session_state.filtered.style.apply(color_row, axis=1)
-      st.dataframe(styled_df, use_container_width=True)
-      csv = st.session_state.filtered.to_csv(index=False)
-      st.download_button(
-                label="Download data as CSV",
-                data=csv,
-                file_name='filtered_data.csv',
-                mime='text/csv',
-            )
+      filtered = st.session_state.filtered
+
+      size_col, page_col, count_col = st.columns([0.2, 0.2, 0.6])
+      page_size = size_col.selectbox('Rows per Page', options=page_sizes, index=1)
+      pages = max(math.ceil(len(filtered) / page_size), 1)
+      page = page_col.number_input('Page', min_value=1, max_value=pages, value=1, step=1)
+
+      start = (page - 1) * page_size
+      stop = min(start + page_size, len(filtered))
+      count_col.write('')
+      count_col.write(f'Showing rows {start + 1 if stop else 0} to {stop} of {len(filtered)}')
+
+      # Colours are computed for the whole filtered table at once and kept per filter state, together with the
+      # slices of the pages already shown. Only the visible page is styled (and serialized by st.dataframe) on a rerun
+      state = (comparison['fingerprint'], year_columns(), st.session_state.filter_state, page_size)
+
+      if not st.session_state.get('rendered'):
+        st.session_state.rendered = {}
+
+      rendered = st.session_state.rendered
+      if state not in rendered:
+        if len(rendered) >= 32:
+          del rendered[next(iter(rendered))]
+        rendered[state] = {'colors' : row_colors(filtered), 'pages' : {}}
+
+      if page not in rendered[state]['pages']:
+        rendered[state]['pages'][page] = page_styles(filtered, rendered[state]['colors'], start, stop)
+
+      page_frame, styles = rendered[state]['pages'][page]
+      st.dataframe(page_frame.style.apply(lambda _ : styles, axis=None), use_container_width=True)
+
+      # Exports are only generated when asked for. A session keeps at most one prepared export, which is
+      # dropped as soon as the inputs, the filters or the format change
+      format_col, button_col = st.columns([0.2, 0.8])
+      export_format = format_col.selectbox('Export Format', options=list(Export.FORMATS))
+      export_key = (state[:-1], export_format)
+
+      if st.session_state.get('export') and st.session_state.export[0] != export_key:
+        st.session_state.export = None
+
+      button_col.write('')
+      button_col.write('')
+      slot = button_col.empty()
+
+      if not st.session_state.get('export'):
+        if slot.button(f'Prepare {export_format} Export'):
+          with st.spinner(f'Exporting {len(filtered)} rows as {export_format}'):
+            st.session_state.export = (export_key, Export.export(filtered, export_format))
+
+      if st.session_state.get('export'):
+        extension, mime = Export.FORMATS[export_format]
+        slot.download_button(
+                  label=f"Download data as {export_format}",
+                  data=st.session_state.export[1],
+                  file_name=f'filtered_data.{extension}',
+                  mime=mime,
+              )
     
   except:
     st.warning("Uploads All Files and Commit properly Before Viewing")
@@ -0,0 +1,118 @@
+import os
+import shutil
+import sys
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Processors import AggregateCube, Round, RankList, SeatMatrix
+
+
+def _round(tmp_path, name, ranks, colleges=None, branches=None, communities=None, cutoffs=None):
+    path = tmp_path / f'{name}.xlsx'
+    pd.DataFrame({
+        'Rank' : ranks,
+        'Cutoff Mark' : cutoffs or [190.0] * len(ranks),
+        'College Code' : colleges or [1000] * len(ranks),
+        'Branch Code' : branches or ['CS'] * len(ranks),
+        'Allotted Community' : communities or ['OC'] * len(ranks)
+    }).to_excel(path, index=False)
+
+    return Round(str(path), name)
+
+
+def test_rank_key_is_the_same_in_every_round(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    first = _round(tmp_path, 'Round 1', ['1234A', '1234B', '1234'])
+    second = _round(tmp_path, 'Round 2', ['1234B'])
+
+    assert first.data['Rank Key'].tolist() == [1234000, 1234001, 1234002]
+    assert second.data['Rank Key'].tolist() == [1234002]
+
+    rank_list = RankList([first, second])
+    assert rank_list.data['Rank Key'].tolist() == [1234000, 1234001, 1234002]
+
+    rank_list = RankList([first])
+    rank_list.add_round(second)
+    assert rank_list.data['Rank Key'].tolist() == [1234000, 1234001, 1234002]
+
+
+def _rounds(tmp_path):
+    return [
+        _round(tmp_path, 'Round 1', [10, 20, 30, 40],
+               colleges=[1000, 1000, 2000, 2000], branches=['CS', 'EC', 'CS', 'CS'],
+               communities=['OC', 'BC', 'OC', 'MBC'], cutoffs=[199.5, 198.0, 197.0, 196.5]),
+        # Rank 20 moves to another college and rank 40 to another branch of the same college.
+        _round(tmp_path, 'Round 2', [20, 40, 50],
+               colleges=[2000, 2000, 1000], branches=['CS', 'EC', 'CS'],
+               communities=['BC', 'MBC', 'SC'], cutoffs=[198.0, 196.5, 195.0]),
+        # Rank 20 moves back, leaving its Round 2 cell empty in the RankList.
+        _round(tmp_path, 'Round 3', [20, 60],
+               colleges=[1000, 2000], branches=['CS', 'CS'],
+               communities=['BC', 'OC'], cutoffs=[198.0, 194.0]),
+    ]
+
+
+def test_cube_built_round_by_round_matches_a_rebuilt_cube(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    rounds = _rounds(tmp_path)
+    queries = [(['College Code'], None), (['College Code', 'Branch Code'], None), (['College Code'], 'BC')]
+
+    rank_list = RankList(rounds[:1])
+    cube = AggregateCube(rounds[:1], rank_list)
+    for keys, community in queries:
+        cube.round_statistics(keys, community=community)
+        cube.rank_list_statistics(keys, community=community)
+
+    for round in rounds[1:]:
+        cube.add_round(round, rank_list)
+        rank_list.add_round(round)
+
+    expected = AggregateCube(rounds, RankList(rounds))
+
+    pd.testing.assert_frame_equal(rank_list.data, RankList(rounds).data, check_categorical=False)
+    assert cube.round_names == expected.round_names
+    pd.testing.assert_frame_equal(cube.rank_list.sort_index(), expected.rank_list.sort_index(), check_dtype=False)
+
+    # Statistics are looked up by label, so rollups extended round by round only need the same cells.
+    for keys, community in queries:
+        for statistics in ['round_statistics', 'rank_list_statistics']:
+            found = getattr(cube, statistics)(keys, community=community)
+            wanted = getattr(expected, statistics)(keys, community=community)
+            pd.testing.assert_frame_equal(found.sort_index().sort_index(axis=1), wanted.sort_index().sort_index(axis=1), check_dtype=False)
+
+
+def test_seat_snapshots_are_rewritten_when_missing_or_moved(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    path = tmp_path / 'SeatMatrix.xlsx'
+    pd.DataFrame({
+        'College Code' : [1000, 1000, 2000, 2000],
+        'College Name' : ['A', 'A', 'B', 'B'],
+        'Branch Code' : ['CS', 'EC', 'CS', 'EC'],
+        'Branch Name' : ['Computer', 'Electronics', 'Computer', 'Electronics'],
+        **{community : [5] * 4 for community in ['OC', 'BC', 'BCM', 'MBC', 'SC', 'SCA', 'ST']}
+    }).to_excel(path, index=False)
+
+    seat_matrix = SeatMatrix(str(path))
+    rounds = _rounds(tmp_path)
+    files = ['Before Round(s).xlsx'] + [f'{{kind}} After {round.name}.xlsx' for round in rounds]
+
+    def written(folder):
+        return all(os.path.exists(f'{folder}/SeatMatrix/{kind}/{name.format(kind=kind)}')
+                   for name in files for kind in ['Remaining', 'Filled'])
+
+    ledger = seat_matrix.evaluate_rounds_sm(rounds, path='2024')
+    assert written('2024')
+
+    shutil.rmtree('2024')
+    ledger = seat_matrix.evaluate_rounds_sm(rounds, path='2024', ledger=ledger)
+    assert written('2024')
+
+    ledger = seat_matrix.evaluate_rounds_sm(rounds, path='2023', ledger=ledger)
+    assert written('2023')
+
+    remaining = pd.read_excel('2023/SeatMatrix/Remaining/Remaining After Round 3.xlsx')
+    assert remaining.set_index(['College Code', 'Branch Code']).loc[(1000, 'CS'), 'BC'] == 4